@@ -0,0 +1,131 @@
+"""
+Benchmarks the NUL separated git log parser against the csv and dateutil
+based parser it replaced, each on its own log format, on a synthetic log.
+
+Run from the project root with:
+
+    PYTHONPATH=src python benchmarks/git_log_parser.py --lines 2000000
+"""
+
+import argparse
+import csv
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, List
+
+import dateutil.parser
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    _parse_change,
+    _parse_git_log_output,
+)
+
+
+def _baseline_iter_git_file_commits(lines: Iterable[str]) -> Iterator[GitFileCommit]:
+    """
+    The parser as it was before NUL separated headers, kept verbatim
+    so the benchmark measures the change against what it replaced.
+    """
+    current_commit = None
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        if line.strip() == "":
+            continue
+
+        if line.strip().startswith("commit:"):
+            header = ["hash", "date", "author", "email", "message"]
+            line = line[7:]
+            reader = csv.reader([line])
+            current_commit = dict(zip(header, next(reader)))
+            current_commit["date"] = dateutil.parser.parse(current_commit["date"])
+
+            current_commit["committer"] = Committer(
+                current_commit["author"], current_commit["email"]
+            )
+            del current_commit["author"]
+            del current_commit["email"]
+            continue
+
+        split_lines = line.split("\t")
+        try:
+            current_commit["insertions"] = _parse_change(split_lines[0])
+            current_commit["deletions"] = _parse_change(split_lines[1])
+            current_commit["filepath"] = split_lines[2]
+        except (ValueError, IndexError):
+            raise Exception(f'Can not parse line: "{line}"')
+
+        yield GitFileCommit(**current_commit)
+
+
+def _baseline_parse_git_log_output(raw_output: str) -> List[GitFileCommit]:
+    return list(_baseline_iter_git_file_commits(raw_output.strip().split("\n")))
+
+
+def _generate_commits(line_count: int, seed: int):
+    rng = random.Random(seed)
+    date = datetime(2015, 1, 1, tzinfo=timezone(timedelta(hours=8)))
+    authors = [(f"Author {i}", f"author{i}@example.com") for i in range(200)]
+    filepaths = [f"src/package_{i % 50}/module_{i}.py" for i in range(5000)]
+
+    lines = 0
+    while lines < line_count:
+        date += timedelta(seconds=rng.randint(1, 3600))
+        commit_hash = "%040x" % rng.getrandbits(160)
+        author, email = rng.choice(authors)
+        # Kept free of quotes and commas, which the legacy format can not carry
+        message = f"Fix issue {lines}"
+        changes = [
+            (rng.randint(0, 200), rng.randint(0, 200), rng.choice(filepaths))
+            for _ in range(rng.randint(1, 10))
+        ]
+        lines += len(changes) + 2
+        yield commit_hash, date.isoformat(), author, email, message, changes
+
+
+def _render(commits, legacy: bool) -> str:
+    chunks = []
+    for commit_hash, date, author, email, message, changes in commits:
+        if legacy:
+            chunks.append(f'commit:{commit_hash},{date},"{author}",{email},"{message}"')
+        else:
+            chunks.append(f"\0{commit_hash}\0{date}\0{author}\0{email}\0{message}")
+        chunks.extend(f"{i}\t{d}\t{filepath}" for i, d, filepath in changes)
+        chunks.append("")
+    return "\n".join(chunks)
+
+
+def _time_parser(
+    name: str, parse: Callable[[str], List[GitFileCommit]], raw_output: str
+) -> float:
+    start = time.perf_counter()
+    file_commits = parse(raw_output)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>10}: {elapsed:8.2f}s for {len(file_commits)} file commits")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    commits = list(_generate_commits(args.lines, args.seed))
+    print(f"Synthetic log: {len(commits)} commits, ~{args.lines} lines")
+
+    baseline = _time_parser(
+        "baseline", _baseline_parse_git_log_output, _render(commits, legacy=True)
+    )
+    separated = _time_parser(
+        "separated", _parse_git_log_output, _render(commits, legacy=False)
+    )
+    print(f"   speedup: {baseline / separated:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class BlobCache:
+    """
+    BlobCache is a persistent, size bounded cache of values computed from
+    the content of git blobs, such as line counts, keyed by blob id, or by
+    a tuple of the blob id and whatever else the value depends on.
+    As a blob id names the content and not its path, one cache file can be
+    shared between worktrees, branches and CI runs.
+
+    Values are stored under a namespace, so that results of different
+    counters never mix. Once more than max_entries values are stored,
+    the least recently used ones are evicted when the cache is saved.
+
+    Args:
+        filepath: The file the cache is kept in
+        namespace: The kind of value cached, e.g. the name of the counter
+        max_entries: The number of values kept when saving
+    """
+
+    def __init__(self, filepath: str, namespace: str, max_entries: int):
+        self._filepath = filepath
+        self._namespace = namespace
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+
+        if os.path.exists(filepath):
+            with open(filepath, "rb") as f:
+                self._entries = pickle.load(f)
+
+    def __contains__(self, blob_key: Hashable) -> bool:
+        return (self._namespace, blob_key) in self._entries
+
+    def __getitem__(self, blob_key: Hashable) -> Any:
+        key = (self._namespace, blob_key)
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def __setitem__(self, blob_key: Hashable, value: Any) -> None:
+        key = (self._namespace, blob_key)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+    def save(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        cache_dir = os.path.dirname(self._filepath)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        # Each writer gets a temp file of its own, so concurrent runs
+        # sharing the cache never interleave their writes in one file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_dir or None, prefix=os.path.basename(self._filepath)
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._filepath)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
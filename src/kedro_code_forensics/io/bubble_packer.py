@@ -26,8 +26,8 @@ html_template = """
                 .range(["hsl(183,100%%,71%%)", "hsl(204,90%%,53%%)"])
                 .interpolate(d3.interpolateHcl);
             let heat_color = d3.scaleLinear()
-                .domain([0, %(max_heat)s])
-                .range(["hsl(54,80%%,80%%)", "hsl(360,100%%,30%%)"])
+                .domain(%(heat_domain)s)
+                .range(%(heat_range)s)
                 .interpolate(d3.interpolateHcl);
             let format = d3.format(",d");
             let height = %(height)s;
@@ -55,7 +55,7 @@ html_template = """
               .selectAll("circle")
               .data(root.descendants().slice(1))
               .join("circle")
-                .attr("fill", d => d.children ? color(d.depth) : heat_color(d.value))
+                .attr("fill", d => d.children ? color(d.depth) : heat_color(d.data.color !== undefined ? d.data.color : d.value))
                 .attr("pointer-events", d => !d.children ? "none" : null)
                 .on("mouseover", function() { d3.select(this).attr("stroke", "#000"); })
                 .on("mouseout", function() { d3.select(this).attr("stroke", null); })
@@ -108,6 +108,12 @@ html_template = """
 </html>
 """  # noqa: E501
 
+# Light yellow for cold files through to dark red for hot ones
+HEAT_RANGE = ["hsl(54,80%,80%)", "hsl(360,100%,30%)"]
+# Blue for values below zero, such as hot spots that cooled down,
+# through light yellow at zero to red for those that heated up
+DIVERGING_HEAT_RANGE = ["hsl(204,90%,45%)", "hsl(54,80%,90%)", "hsl(360,100%,35%)"]
+
 
 class BubblePack(NamedTuple):
     """
@@ -116,11 +122,14 @@ class BubblePack(NamedTuple):
         path: The list values that represent the hierarchy for this one leaf
         size: The relative size of this leaf
         value: The relative color value for this leaf
+        color: An alternative color value for this leaf, such as its age,
+            used in place of value when given
     """
 
     path: List[str]
     size: int
     value: int
+    color: Optional[float] = None
 
 
 def _aggregate_bubble_packs(data: List[BubblePack]) -> Dict[str, Any]:
@@ -139,6 +148,8 @@ def _aggregate_bubble_packs(data: List[BubblePack]) -> Dict[str, Any]:
             "size": bubble_file.size,
             "/is_leaf": True,
         }
+        if bubble_file.color is not None:
+            pointer[bubble_file.path[-1]]["color"] = bubble_file.color
 
     return packable
 
@@ -169,9 +180,13 @@ class BubblePackerDataSet(DefaultArgumentsMixIn, AbstractVersionedDataSet):
     BubblePackerDataSet is a simple DataSet
     that takes in a list of BubblePack values and
     generates a bubble packer graph.
+    Args:
+        save_args: The width and height of the graph, and diverging
+            to color the values on a scale centred on zero, for values
+            that may be negative such as changes in a rating
     """
 
-    DEFAULT_SAVE_ARGS = {"width": 932, "height": 600}
+    DEFAULT_SAVE_ARGS = {"width": 932, "height": 600, "diverging": False}
 
     def __init__(
         self, filepath: PurePath, version: Optional[Version] = None, *args, **kwargs
@@ -186,15 +201,26 @@ class BubblePackerDataSet(DefaultArgumentsMixIn, AbstractVersionedDataSet):
         childrenized_data = _rec_childrenizer("root", aggregated_bubble_packs)
         os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
         max_domain = max([len(d.path) for d in data])
-        max_heat = max([d.value for d in data])
+        heats = [d.value if d.color is None else d.color for d in data]
+        save_args = dict(self._save_args)
+        if save_args.pop("diverging"):
+            # Symmetric around zero, so equal changes either way
+            # are as strongly colored
+            max_heat = max(abs(heat) for heat in heats) or 1
+            heat_domain = [-max_heat, 0, max_heat]
+            heat_range = DIVERGING_HEAT_RANGE
+        else:
+            heat_domain = [0, max(heats)]
+            heat_range = HEAT_RANGE
         with open(self._filepath, "w+", encoding="utf8") as f:
             f.write(
                 html_template
                 % {
                     "json": json.dumps(childrenized_data, cls=_BubbleJSONDecoder),
                     "max_domain": max_domain,
-                    "max_heat": max_heat,
-                    **self._save_args,
+                    "heat_domain": json.dumps(heat_domain, cls=_BubbleJSONDecoder),
+                    "heat_range": json.dumps(heat_range),
+                    **save_args,
                 }
             )
 
@@ -1,11 +1,39 @@
 import json
+import os
+import posixpath
+import re
 import subprocess
+import tempfile
 from pathlib import PurePath
-from typing import Any, Dict, List, NamedTuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from kedro.io import AbstractVersionedDataSet
+from kedro.io import AbstractVersionedDataSet, DataSetError
 
+from kedro_code_forensics.io.blob_cache import BlobCache
 from kedro_code_forensics.io.expections import ReadOnlyDataSet
+from kedro_code_forensics.io.git_objects import (
+    BlobReader,
+    tree_blob_ids,
+    working_tree_blob_ids,
+)
+from kedro_code_forensics.io.line_counter import (
+    DEFAULT_EXCLUDED_DIRS,
+    LineCount,
+    count_blob,
+    count_files,
+    filter_files,
+    select_files,
+)
 
 
 class ClocFile(NamedTuple):
@@ -25,25 +53,146 @@ class ClocFile(NamedTuple):
     language: str
 
 
+# The number of characters of cloc output read from the pipe at a time
+CLOC_READ_SIZE = 65536
+# cloc's own metadata, which sits next to the files in its JSON output
+_CLOC_METADATA_KEYS = ("header", "SUM")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _strip_base_path(base_path: str, raw_file_path: str) -> str:
+    if raw_file_path.startswith(base_path):
+        return raw_file_path[len(base_path) :]
+    return raw_file_path
+
+
 def _parse_cloc_output(
     base_path: str, raw_cloc_data: Dict[str, Dict[str, Union[str, int]]]
 ) -> List[ClocFile]:
-    out_cloc_files = []
+    if not base_path.endswith("/"):
+        base_path += "/"
+
+    return [
+        ClocFile(_strip_base_path(base_path, raw_file_path), **file_data)
+        for raw_file_path, file_data in raw_cloc_data.items()
+        if raw_file_path not in _CLOC_METADATA_KEYS
+    ]
+
+
+def _iter_json_object_members(chunks: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally parses a JSON object arriving in chunks of text,
+    yielding each of its (key, value) members as soon as it is complete.
+    Only the member being parsed is held in memory.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ""
+    index = 0
+
+    def _read_more() -> bool:
+        nonlocal buffer, index
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        buffer = buffer[index:] + chunk
+        index = 0
+        return True
 
+    def _next_character() -> str:
+        nonlocal index
+        while True:
+            index = _WHITESPACE.match(buffer, index).end()
+            if index < len(buffer):
+                return buffer[index]
+            if not _read_more():
+                raise DataSetError("Unexpected end of cloc output")
+
+    def _expect(expected: str) -> str:
+        nonlocal index
+        character = _next_character()
+        if character not in expected:
+            raise DataSetError(f"Expected one of {expected!r}, found {character!r}")
+        index += 1
+        return character
+
+    def _decode() -> Any:
+        nonlocal index
+        _next_character()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if not _read_more():
+                    raise
+                continue
+            # A value running up to the end of the buffer,
+            # such as a number, may carry on in the next chunk
+            if end == len(buffer) and _read_more():
+                continue
+            index = end
+            return value
+
+    _expect("{")
+    if _next_character() == "}":
+        return
+
+    while True:
+        key = _decode()
+        _expect(":")
+        yield key, _decode()
+        if _expect(",}") == "}":
+            return
+
+
+def _iter_cloc_output(base_path: str, chunks: Iterable[str]) -> Iterator[ClocFile]:
+    """
+    Parses the output of cloc --by-file --json as it arrives,
+    yielding a ClocFile for every file with base_path sliced off its path.
+    """
     if not base_path.endswith("/"):
         base_path += "/"
 
-    # Drop the extra unneeded metadata
-    if "header" in raw_cloc_data:
-        del raw_cloc_data["header"]
-    if "SUM" in raw_cloc_data:
-        del raw_cloc_data["SUM"]
+    for raw_file_path, file_data in _iter_json_object_members(chunks):
+        if raw_file_path not in _CLOC_METADATA_KEYS:
+            yield ClocFile(_strip_base_path(base_path, raw_file_path), **file_data)
+
 
-    for raw_file_path, file_data in raw_cloc_data.items():
-        filepath = raw_file_path.replace(base_path, "")
-        out_cloc_files.append(ClocFile(filepath, **file_data))
+def _stream_cloc(cloc_command: List[str]) -> Iterator[str]:
+    process = subprocess.Popen(cloc_command, stdout=subprocess.PIPE, encoding="UTF8")
+    with process:
+        yield from iter(lambda: process.stdout.read(CLOC_READ_SIZE), "")
 
-    return out_cloc_files
+    if process.returncode != 0:
+        raise DataSetError(
+            subprocess.CalledProcessError(process.returncode, cloc_command)
+        )
+
+
+def _line_count_keys(blob_ids: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Keys the line count of each file by its blob id and its extension,
+    or its name when it has none, as the language and so the count of
+    the same content depends on it, e.g. for a.py and a copy at a.js.
+    """
+    keys = {}
+    for filepath, blob_id in blob_ids.items():
+        filename = posixpath.basename(filepath)
+        keys[filepath] = (blob_id, posixpath.splitext(filename)[1].lower() or filename)
+    return keys
+
+
+def _cached_cloc_files(
+    filepaths: List[str],
+    keys: Dict[str, Tuple[str, str]],
+    cache: Union[BlobCache, Dict[Tuple[str, str], Optional[LineCount]]],
+) -> List[ClocFile]:
+    cloc_files = []
+    for filepath in filepaths:
+        line_count = cache[keys[filepath]]
+        if line_count is not None:
+            cloc_files.append(ClocFile(filepath, *line_count))
+    return cloc_files
 
 
 class ClocFileDataSet(AbstractVersionedDataSet):
@@ -54,32 +203,187 @@ class ClocFileDataSet(AbstractVersionedDataSet):
     Args:
         filepath: The path to the directory that we will be counting
         excluded_dirs: A list of directories that we will be excluding
+        counter: "cloc" to run the cloc command, or "builtin" to count
+            lines with the built-in counter, which needs no Perl install
+            and counts files in parallel
+        workers: The number of processes the built-in counter uses.
+            Defaults to the number of CPUs
+        cache_path: A file in which to keep line counts between runs,
+            keyed by the git blob id of each file's content, so only
+            changed files are counted again. The directory must be
+            inside a git repository
+        cache_size: The number of line counts kept in the cache.
+            The least recently used ones are evicted beyond that
+        tracked_only: Only count the files git tracks, as listed by
+            git ls-files, instead of walking the whole directory.
+            Ignored, untracked and sparse checkout files are skipped
+        ref: A git ref, such as a tag, branch or commit, whose tree is
+            counted instead of the working directory. Its blobs are read
+            from the object database and counted in memory with the
+            built-in counter, so nothing is checked out or written to disk
     """
 
-    DEFAULT_EXCLUDED_DIRS = ["venv"]
+    DEFAULT_EXCLUDED_DIRS = DEFAULT_EXCLUDED_DIRS
+    DEFAULT_CACHE_SIZE = 1000000
+    COUNTERS = ("cloc", "builtin")
 
     def __init__(
-        self, filepath: PurePath, excluded_dirs: List[str] = None, *args, **kwargs
+        self,
+        filepath: PurePath,
+        excluded_dirs: List[str] = None,
+        counter: str = "cloc",
+        workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        tracked_only: bool = False,
+        ref: Optional[str] = None,
+        *args,
+        **kwargs,
     ):
         super().__init__(filepath, version=None, *args, **kwargs)
+        if counter not in self.COUNTERS:
+            raise DataSetError(
+                f"Unknown counter {counter!r}, expected one of {self.COUNTERS}"
+            )
         self._excluded_dirs = excluded_dirs or self.DEFAULT_EXCLUDED_DIRS
+        self._counter = counter
+        self._workers = workers
+        self._cache_path = cache_path
+        self._cache_size = cache_size
+        self._tracked_only = tracked_only
+        self._ref = ref
 
-    def _load(self) -> Any:
+    def _load_cloc(self) -> List[ClocFile]:
         excluded_dirs = []
 
         if len(self._excluded_dirs) > 0:
             excluded_dirs = ["--exclude-dir"] + self._excluded_dirs
 
-        raw_json = subprocess.check_output(
+        cloc_output = _stream_cloc(
             ["cloc", "--by-file", *excluded_dirs, "--json", self._filepath]
         )
 
-        raw_cloc_data = json.loads(raw_json)
+        return list(_iter_cloc_output(self._filepath, cloc_output))
+
+    def _count_listed_with_cloc(
+        self, filepaths: List[str]
+    ) -> Iterator[Tuple[str, LineCount]]:
+        root = os.path.abspath(self._filepath)
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as list_file:
+            list_file.write(
+                "\n".join(os.path.join(root, filepath) for filepath in filepaths)
+            )
+            list_file.flush()
+            # cloc skips files whose content it has already seen,
+            # which would leave copies of a file uncounted
+            cloc_output = _stream_cloc(
+                [
+                    "cloc",
+                    "--by-file",
+                    "--skip-uniqueness",
+                    "--json",
+                    f"--list-file={list_file.name}",
+                ]
+            )
+
+            for cloc_file in _iter_cloc_output(root, cloc_output):
+                yield cloc_file.filepath, LineCount(*cloc_file[1:])
+
+    def _count_listed(self, filepaths: List[str]) -> Iterator[Tuple[str, LineCount]]:
+        if not filepaths:
+            return iter([])
+        if self._counter == "builtin":
+            return count_files(self._filepath, filepaths, self._workers)
+        return self._count_listed_with_cloc(filepaths)
+
+    def _list_files(self) -> List[str]:
+        # cloc recognises more languages than the built-in counter,
+        # so it is handed every file and decides for itself
+        return select_files(
+            self._filepath,
+            self._excluded_dirs,
+            self._tracked_only,
+            known_languages_only=self._counter == "builtin",
+        )
+
+    def _load_listed(self) -> List[ClocFile]:
+        return [
+            ClocFile(filepath, *line_count)
+            for filepath, line_count in self._count_listed(self._list_files())
+        ]
 
-        return _parse_cloc_output(self._filepath, raw_cloc_data)
+    def _load_cached(self) -> List[ClocFile]:
+        filepaths = self._list_files()
+        keys = _line_count_keys(working_tree_blob_ids(self._filepath, filepaths))
+        cache = BlobCache(self._cache_path, self._counter, self._cache_size)
+
+        uncounted = [filepath for filepath in filepaths if keys[filepath] not in cache]
+        line_counts = dict(self._count_listed(uncounted))
+        for filepath in uncounted:
+            # Files the counter skipped are cached as None, so they are not
+            # offered to it again, but never over the count of a copy
+            line_count = line_counts.get(filepath)
+            if line_count is not None or keys[filepath] not in cache:
+                cache[keys[filepath]] = line_count
+
+        cloc_files = _cached_cloc_files(filepaths, keys, cache)
+        cache.save()
+        return cloc_files
+
+    def _load_ref(self) -> List[ClocFile]:
+        blob_ids = tree_blob_ids(self._filepath, self._ref)
+        filepaths = list(
+            filter_files(blob_ids, self._excluded_dirs, known_languages_only=True)
+        )
+        # Counts are always made by the built-in counter,
+        # so they are shared with its working directory counts
+        cache: Union[BlobCache, Dict[Tuple[str, str], Optional[LineCount]]] = {}
+        if self._cache_path is not None:
+            cache = BlobCache(self._cache_path, "builtin", self._cache_size)
+
+        # A blob is read once for each extension it is found with,
+        # however many paths it is found at
+        keys = _line_count_keys(
+            {filepath: blob_ids[filepath] for filepath in filepaths}
+        )
+        uncounted: Dict[str, List[str]] = {}
+        for filepath in filepaths:
+            if keys[filepath] not in cache:
+                counted_as = uncounted.setdefault(blob_ids[filepath], [])
+                if all(keys[other] != keys[filepath] for other in counted_as):
+                    counted_as.append(filepath)
+
+        if uncounted:
+            with BlobReader(self._filepath) as reader:
+                for blob_id, content in reader.iter_blobs(uncounted):
+                    for filepath in uncounted[blob_id]:
+                        cache[keys[filepath]] = count_blob(filepath, content)
+
+        cloc_files = _cached_cloc_files(filepaths, keys, cache)
+        if isinstance(cache, BlobCache):
+            cache.save()
+        return cloc_files
+
+    def _load(self) -> Any:
+        if self._ref is not None:
+            return self._load_ref()
+        if self._cache_path is not None:
+            return self._load_cached()
+        if self._counter == "builtin" or self._tracked_only:
+            return self._load_listed()
+        return self._load_cloc()
 
     def _save(self, data: Any) -> None:
         raise ReadOnlyDataSet()
 
     def _describe(self) -> Dict[str, Any]:
-        return dict(filepath=self._filepath, excluded_dirs=self._excluded_dirs,)
+        return dict(
+            filepath=self._filepath,
+            excluded_dirs=self._excluded_dirs,
+            counter=self._counter,
+            workers=self._workers,
+            cache_path=self._cache_path,
+            cache_size=self._cache_size,
+            tracked_only=self._tracked_only,
+            ref=self._ref,
+        )
@@ -0,0 +1,224 @@
+import ast
+from pathlib import PurePath
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from kedro.io import AbstractVersionedDataSet
+
+from kedro_code_forensics.io.blob_cache import BlobCache
+from kedro_code_forensics.io.expections import ReadOnlyDataSet
+from kedro_code_forensics.io.git_objects import working_tree_blob_ids
+from kedro_code_forensics.io.line_counter import (
+    DEFAULT_EXCLUDED_DIRS,
+    language_of,
+    map_files,
+    select_files,
+)
+
+
+class FunctionComplexity(NamedTuple):
+    """
+    FunctionComplexity is the cyclomatic complexity of one function.
+        name: The qualified name of the function, e.g. Class.method
+        lineno: The line the function is defined on
+        complexity: One plus the number of decision points in its body
+    """
+
+    name: str
+    lineno: int
+    complexity: int
+
+
+class CyclomaticComplexity(NamedTuple):
+    """
+    CyclomaticComplexity is the cyclomatic complexity of a Python file.
+        complexity: The sum of the complexity of its functions and of
+            its module level code, which counts as one more function
+        functions: The complexity of each of its functions
+    """
+
+    complexity: int
+    functions: Tuple[FunctionComplexity, ...]
+
+
+_DECISIONS = tuple(
+    getattr(ast, name)
+    for name in (
+        "If",
+        "IfExp",
+        "For",
+        "AsyncFor",
+        "While",
+        "ExceptHandler",
+        "Assert",
+        "match_case",
+    )
+    if hasattr(ast, name)
+)
+
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """
+    Counts the decision points of each function separately,
+    so a nested function adds nothing to the one defining it.
+    """
+
+    def __init__(self):
+        self.functions: List[FunctionComplexity] = []
+        self._names: List[str] = []
+        self._decisions = [0]
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, _DECISIONS):
+            self._decisions[-1] += 1
+        elif isinstance(node, ast.BoolOp):
+            self._decisions[-1] += len(node.values) - 1
+        elif isinstance(node, ast.comprehension):
+            self._decisions[-1] += 1 + len(node.ifs)
+        super().generic_visit(node)
+
+    def _visit_function(self, node: ast.AST) -> None:
+        self._names.append(node.name)
+        self._decisions.append(0)
+        super().generic_visit(node)
+        decisions = self._decisions.pop()
+        self.functions.append(
+            FunctionComplexity(".".join(self._names), node.lineno, decisions + 1)
+        )
+        self._names.pop()
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._names.append(node.name)
+        super().generic_visit(node)
+        self._names.pop()
+
+    @property
+    def module_complexity(self) -> int:
+        return self._decisions[0] + 1
+
+
+def cyclomatic_complexity(source: bytes) -> Optional[CyclomaticComplexity]:
+    """
+    Computes the cyclomatic complexity of Python source and of each of
+    its functions, counting if, elif, loops, except handlers, asserts,
+    conditional expressions, comprehensions, match cases and the extra
+    operands of boolean operators as decision points.
+    Returns None for source that does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    visitor = _ComplexityVisitor()
+    visitor.visit(tree)
+    functions = tuple(sorted(visitor.functions, key=lambda function: function.lineno))
+    total = visitor.module_complexity + sum(
+        function.complexity for function in functions
+    )
+    return CyclomaticComplexity(total, functions)
+
+
+def measure_file(filepath: str) -> Optional[CyclomaticComplexity]:
+    with open(filepath, "rb") as f:
+        return cyclomatic_complexity(f.read())
+
+
+def _is_python(filepath: str) -> bool:
+    syntax = language_of(filepath)
+    return syntax is not None and syntax.name == "Python"
+
+
+class CyclomaticComplexityDataSet(AbstractVersionedDataSet):
+    """
+    CyclomaticComplexityDataSet returns the CyclomaticComplexity of each
+    Python file found in the specified filepath, keyed by its path relative
+    to filepath. Files that do not parse are left out.
+    Files are parsed in a pool of processes.
+    Args:
+        filepath: The path to the directory that we will be measuring
+        excluded_dirs: A list of directories that we will be excluding
+        tracked_only: Only measure the files git tracks, as listed by
+            git ls-files, instead of walking the whole directory
+        workers: The number of processes used. Defaults to the number of CPUs
+        cache_path: A file in which to keep each file's complexity, or
+            that it does not parse, under the git blob id of its source.
+            A later run parses only the files edited since. The directory
+            must be inside a git repository
+        cache_size: The number of complexities kept in the cache.
+            Those not read for longest are dropped beyond that
+    """
+
+    DEFAULT_CACHE_SIZE = 1000000
+
+    def __init__(
+        self,
+        filepath: PurePath,
+        excluded_dirs: List[str] = None,
+        tracked_only: bool = False,
+        workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(filepath, version=None, *args, **kwargs)
+        self._excluded_dirs = excluded_dirs or DEFAULT_EXCLUDED_DIRS
+        self._tracked_only = tracked_only
+        self._workers = workers
+        self._cache_path = cache_path
+        self._cache_size = cache_size
+
+    def _list_files(self) -> List[str]:
+        filepaths = select_files(
+            self._filepath, self._excluded_dirs, self._tracked_only
+        )
+        return [filepath for filepath in filepaths if _is_python(filepath)]
+
+    def _measure(self, filepaths: List[str]) -> Dict[str, CyclomaticComplexity]:
+        if not filepaths:
+            return {}
+        return dict(map_files(measure_file, self._filepath, filepaths, self._workers))
+
+    def _load_cached(self) -> Dict[str, CyclomaticComplexity]:
+        filepaths = self._list_files()
+        blob_ids = working_tree_blob_ids(self._filepath, filepaths)
+        cache = BlobCache(self._cache_path, "cyclomatic", self._cache_size)
+
+        unmeasured = [
+            filepath for filepath in filepaths if blob_ids[filepath] not in cache
+        ]
+        complexities = self._measure(unmeasured)
+        for filepath in unmeasured:
+            # Files that do not parse are cached as None,
+            # so they are not parsed again
+            cache[blob_ids[filepath]] = complexities.get(filepath)
+
+        measured = {}
+        for filepath in filepaths:
+            complexity = cache[blob_ids[filepath]]
+            if complexity is not None:
+                measured[filepath] = complexity
+
+        cache.save()
+        return measured
+
+    def _load(self) -> Dict[str, CyclomaticComplexity]:
+        if self._cache_path is not None:
+            return self._load_cached()
+        return self._measure(self._list_files())
+
+    def _save(self, data: Any) -> None:
+        raise ReadOnlyDataSet()
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            excluded_dirs=self._excluded_dirs,
+            tracked_only=self._tracked_only,
+            workers=self._workers,
+            cache_path=self._cache_path,
+            cache_size=self._cache_size,
+        )
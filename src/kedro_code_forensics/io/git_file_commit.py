@@ -1,10 +1,29 @@
 import csv
+import os
+import pickle
+import re
 import subprocess
-from datetime import datetime
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import PurePath
-from typing import Any, Dict, List, NamedTuple, Optional, TextIO
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import dateutil
+import numpy as np
 from kedro.io import AbstractVersionedDataSet, DataSetError
 
 from kedro_code_forensics.io.expections import ReadOnlyDataSet
@@ -37,61 +56,570 @@ class GitFileCommit(NamedTuple):
     deletions: int
 
 
+class GitFileCommitTable(NamedTuple):
+    """
+    GitFileCommitTable is a columnar, dictionary encoded alternative
+    to a list of GitFileCommit tuples. Every row is one file in one commit.
+    Repeated values are stored once and referred to by integer ids.
+
+        commit_ids: The index into hashes and messages of each row
+        filepath_ids: The index into filepaths of each row
+        committer_ids: The index into committers of each row
+        timestamps: The commit date of each row, in seconds since the epoch
+        insertions: The number of insertions of each row
+        deletions: The number of deletions of each row
+        hashes: The hash value of each commit
+        messages: The commit summary line of each commit
+        filepaths: The distinct filepaths
+        committers: The distinct committers
+    """
+
+    commit_ids: np.ndarray
+    filepath_ids: np.ndarray
+    committer_ids: np.ndarray
+    timestamps: np.ndarray
+    insertions: np.ndarray
+    deletions: np.ndarray
+    hashes: List[str]
+    messages: List[str]
+    filepaths: List[str]
+    committers: List[Committer]
+
+    @classmethod
+    def from_commits(
+        cls, git_file_commits: Iterable[GitFileCommit]
+    ) -> "GitFileCommitTable":
+        """
+        Builds a table from GitFileCommits, consuming them one at a time
+        so a streamed git log is never held as a list of tuples.
+        """
+        commit_ids, filepath_ids, committer_ids = array("i"), array("i"), array("i")
+        timestamps, insertions, deletions = array("q"), array("q"), array("q")
+        hash_index: Dict[str, int] = {}
+        filepath_index: Dict[str, int] = {}
+        committer_index: Dict[Committer, int] = {}
+        messages = []
+
+        for file_commit in git_file_commits:
+            commit_id = hash_index.get(file_commit.hash)
+            if commit_id is None:
+                commit_id = hash_index[file_commit.hash] = len(hash_index)
+                messages.append(file_commit.message)
+            commit_ids.append(commit_id)
+            filepath_ids.append(
+                filepath_index.setdefault(file_commit.filepath, len(filepath_index))
+            )
+            committer_ids.append(
+                committer_index.setdefault(file_commit.committer, len(committer_index))
+            )
+            timestamps.append(int(file_commit.date.timestamp()))
+            insertions.append(file_commit.insertions)
+            deletions.append(file_commit.deletions)
+
+        return cls(
+            commit_ids=np.frombuffer(commit_ids, dtype=np.intc),
+            filepath_ids=np.frombuffer(filepath_ids, dtype=np.intc),
+            committer_ids=np.frombuffer(committer_ids, dtype=np.intc),
+            timestamps=np.frombuffer(timestamps, dtype=np.int64),
+            insertions=np.frombuffer(insertions, dtype=np.int64),
+            deletions=np.frombuffer(deletions, dtype=np.int64),
+            hashes=list(hash_index),
+            messages=messages,
+            filepaths=list(filepath_index),
+            committers=list(committer_index),
+        )
+
+    def to_commits(self) -> Iterator[GitFileCommit]:
+        """
+        Yields the rows of the table back as GitFileCommits.
+        Dates come back in UTC, as the table only keeps epoch timestamps.
+        """
+        for row in range(len(self.commit_ids)):
+            commit_id = self.commit_ids[row]
+            yield GitFileCommit(
+                self.hashes[commit_id],
+                datetime.fromtimestamp(int(self.timestamps[row]), timezone.utc),
+                self.committers[self.committer_ids[row]],
+                self.messages[commit_id],
+                self.filepaths[self.filepath_ids[row]],
+                int(self.insertions[row]),
+                int(self.deletions[row]),
+            )
+
+    @classmethod
+    def concatenate(
+        cls, tables: Iterable["GitFileCommitTable"]
+    ) -> "GitFileCommitTable":
+        """
+        Joins tables one after another, such as newly parsed commits and
+        a cached table. Only their distinct values are merged in Python,
+        and the ids of every row are remapped with one array lookup.
+        """
+        hash_index: Dict[str, int] = {}
+        filepath_index: Dict[str, int] = {}
+        committer_index: Dict[Committer, int] = {}
+        messages: List[str] = []
+        commit_ids = [np.empty(0, dtype=np.intc)]
+        filepath_ids = [np.empty(0, dtype=np.intc)]
+        committer_ids = [np.empty(0, dtype=np.intc)]
+        timestamps = [np.empty(0, dtype=np.int64)]
+        insertions = [np.empty(0, dtype=np.int64)]
+        deletions = [np.empty(0, dtype=np.int64)]
+
+        for table in tables:
+            new_commits = len(hash_index)
+            commit_map = _merge_values(hash_index, table.hashes)
+            messages.extend(
+                message
+                for message, commit_id in zip(table.messages, commit_map)
+                if commit_id >= new_commits
+            )
+            filepath_map = _merge_values(filepath_index, table.filepaths)
+            committer_map = _merge_values(committer_index, table.committers)
+
+            commit_ids.append(commit_map[table.commit_ids])
+            filepath_ids.append(filepath_map[table.filepath_ids])
+            committer_ids.append(committer_map[table.committer_ids])
+            timestamps.append(table.timestamps)
+            insertions.append(table.insertions)
+            deletions.append(table.deletions)
+
+        return cls(
+            commit_ids=np.concatenate(commit_ids),
+            filepath_ids=np.concatenate(filepath_ids),
+            committer_ids=np.concatenate(committer_ids),
+            timestamps=np.concatenate(timestamps),
+            insertions=np.concatenate(insertions),
+            deletions=np.concatenate(deletions),
+            hashes=list(hash_index),
+            messages=messages,
+            filepaths=list(filepath_index),
+            committers=list(committer_index),
+        )
+
+
+def _merge_values(index: Dict[Any, int], values: List[Any]) -> np.ndarray:
+    """
+    Adds values not in index yet and returns the id in index of each of values.
+    """
+    return np.array(
+        [index.setdefault(value, len(index)) for value in values], dtype=np.intc
+    )
+
+
+def as_git_file_commit_table(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+) -> GitFileCommitTable:
+    """
+    Returns git_file_commits as a GitFileCommitTable,
+    building one only when it is not a table already.
+    """
+    if isinstance(git_file_commits, GitFileCommitTable):
+        return git_file_commits
+    return GitFileCommitTable.from_commits(git_file_commits)
+
+
 def _count_lines(file_pointer: TextIO):
     return sum([1 for _ in file_pointer.readline()])
 
 
-def _parse_git_log_output(raw_output: str) -> List[GitFileCommit]:
+# git log --pretty format whose header lines start with, and
+# whose fields are separated by, a NUL byte. Unlike quotes or commas,
+# NUL can never appear in an author name or commit subject
+GIT_LOG_FORMAT = "--pretty=format:%x00%H%x00%cI%x00%an%x00%ae%x00%s"
+_FIELD_SEPARATOR = "\0"
+_LEGACY_HEADER_PREFIX = "commit:"
+
+_TIMEZONES: Dict[str, timezone] = {"Z": timezone.utc}
+
+
+def _parse_iso_date(value: str) -> datetime:
+    """
+    Parses the strict ISO-8601 date git prints for %cI,
+    e.g. 2020-03-01T18:14:49+08:00, by slicing its fixed-width fields.
+    """
+    offset = value[19:]
+    tzinfo = _TIMEZONES.get(offset)
+    if tzinfo is None:
+        sign = -1 if offset[0] == "-" else 1
+        tzinfo = timezone(
+            sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        )
+        _TIMEZONES[offset] = tzinfo
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=tzinfo,
+    )
+
+
+def _parse_legacy_commit_header(line: str) -> Tuple[str, datetime, str, str, str]:
+    reader = csv.reader([line[len(_LEGACY_HEADER_PREFIX) :]])
+    commit_hash, date, author, email, message = next(reader)
+    return commit_hash, dateutil.parser.parse(date), author, email, message
+
+
+def _parse_commit_header(line: str) -> Tuple[str, datetime, str, str, str]:
+    if line[0] != _FIELD_SEPARATOR:
+        return _parse_legacy_commit_header(line)
+
+    commit_hash, date, author, email, message = line[1:].split(_FIELD_SEPARATOR, 4)
+    return commit_hash, _parse_iso_date(date), author, email, message
+
+
+def _parse_change(change: str) -> int:
+    if change == "-":
+        return 0
+    return int(change)
+
+
+class CommitFilter(NamedTuple):
+    """
+    CommitFilter describes which commits are dropped while the git log
+    is parsed, before any GitFileCommit is created for their files.
+        max_files: Drop commits that change more files than this
+        excluded_authors: Drop commits whose "name <email>" matches this
+        excluded_messages: Drop commits whose summary line matches this
+    """
+
+    max_files: Optional[int] = None
+    excluded_authors: Optional[Pattern] = None
+    excluded_messages: Optional[Pattern] = None
+
+    def excludes(self, author: str, email: str, message: str) -> bool:
+        if self.excluded_authors is not None and self.excluded_authors.search(
+            f"{author} <{email}>"
+        ):
+            return True
+        if self.excluded_messages is not None and self.excluded_messages.search(
+            message
+        ):
+            return True
+        return False
+
+
+# Short form pathspec magic signatures, e.g. :!venv or :/!venv
+_SHORT_PATHSPEC_MAGIC = {"/": "top", "!": "exclude", "^": "exclude"}
+
+
+def _exclude_pathspec(path: str) -> str:
+    """
+    Turns an excluded_paths entry into a pathspec that excludes it.
+    Entries with pathspec magic keep their magic, with exclude added when
+    it is missing, so e.g. :(glob)**/*.lock excludes the lock files rather
+    than limiting the log to them.
+    """
+    if not path.startswith(":"):
+        return f":(exclude){path}"
+
+    if path.startswith(":("):
+        end = path.find(")")
+        if end < 0:
+            raise DataSetError(f"Unterminated pathspec magic in {path!r}")
+        magic = [word.strip() for word in path[2:end].split(",") if word.strip()]
+        rest = path[end + 1 :]
+    else:
+        signature_end = 1
+        while (
+            signature_end < len(path) and path[signature_end] in _SHORT_PATHSPEC_MAGIC
+        ):
+            signature_end += 1
+        magic = list(
+            dict.fromkeys(
+                _SHORT_PATHSPEC_MAGIC[signature] for signature in path[1:signature_end]
+            )
+        )
+        rest = path[signature_end:]
+        if rest.startswith(":"):
+            rest = rest[1:]
+
+    if "exclude" not in magic:
+        magic.append("exclude")
+    return f":({','.join(magic)}){rest}"
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[Pattern]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _iter_git_file_commits(
+    lines: Iterable[str], commit_filter: Optional[CommitFilter] = None
+) -> Iterator[GitFileCommit]:
+    """
+    Lazily parses git log lines into individual commits for files.
+    Only the current commit is held in memory, so this can
+    be fed straight from a pipe.
+
+    Args:
+        lines: The lines of a git log formatted with GIT_LOG_FORMAT,
+            or with the older --format='commit:%H,%ci,"%an",%ae,"%s"'
+        commit_filter: The commits to skip. The file lines of a skipped
+            commit are never parsed
+
+    Returns:
+        An iterator of GitFileCommits, in the same order as the log.
+    """
+    commit_hash = date = committer = message = None
+    committers: Dict[Tuple[str, str], Committer] = {}
+    max_files = commit_filter.max_files if commit_filter is not None else None
+    skip_commit = False
+    # File lines are held back until the commit is known to be
+    # small enough when there is a limit on the files per commit
+    pending_lines: List[str] = []
+
+    def _parse_file_commit(line: str) -> GitFileCommit:
+        try:
+            insertions, deletions, filepath = line.split("\t", 2)
+            return GitFileCommit(
+                commit_hash,
+                date,
+                committer,
+                message,
+                filepath,
+                _parse_change(insertions),
+                _parse_change(deletions),
+            )
+        except ValueError:
+            raise Exception(f'Can not parse line: "{line}"')
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        if not line:
+            continue
+
+        if line[0] == _FIELD_SEPARATOR or line.startswith(_LEGACY_HEADER_PREFIX):
+            for pending_line in pending_lines:
+                yield _parse_file_commit(pending_line)
+            pending_lines = []
+
+            commit_hash, date, author, email, message = _parse_commit_header(line)
+            skip_commit = commit_filter is not None and commit_filter.excludes(
+                author, email, message
+            )
+
+            # Share one Committer tuple between all of an author's commits
+            committer = committers.get((author, email))
+            if committer is None:
+                committer = committers[(author, email)] = Committer(author, email)
+            continue
+
+        if skip_commit:
+            continue
+
+        if max_files is None:
+            yield _parse_file_commit(line)
+            continue
+
+        pending_lines.append(line)
+        if len(pending_lines) > max_files:
+            skip_commit = True
+            pending_lines = []
+
+    for pending_line in pending_lines:
+        yield _parse_file_commit(pending_line)
+
+
+def _parse_git_log_output(
+    raw_output: str, commit_filter: Optional[CommitFilter] = None
+) -> List[GitFileCommit]:
     """
     Parses a raw git log into individual commits for files
 
     Args:
         raw_output: The raw log output of a git log formatted with
-            --format='commit:%H,%ci,%an,%ae,%s'
+            GIT_LOG_FORMAT
+        commit_filter: The commits to skip while parsing
 
     Returns:
         A list of GitFileCommits that can be used for analysis.
     """
-    out_commits = []
+    return list(_iter_git_file_commits(raw_output.strip().split("\n"), commit_filter))
 
-    current_commit = None
 
-    parseable_lines = raw_output.strip().split("\n")
+# Matches git's compact rename notation, e.g. src/{old => new}/module.py
+_RENAME_IN_BRACES = re.compile(r"^(.*){(.*) => (.*)}(.*)$")
+_RENAME_SEPARATOR = " => "
 
-    def _parse_change(change: str):
-        if change == "-":
-            return 0
-        return int(change)
 
-    for line in parseable_lines:
+def _join_rename_path(prefix: str, part: str, suffix: str) -> str:
+    # An empty side of a rename, e.g. src/{ => nested}/module.py,
+    # leaves a doubled or leading slash behind
+    return f"{prefix}{part}{suffix}".replace("//", "/").lstrip("/")
 
-        if line.strip() == "":
-            continue
 
-        if line.strip().startswith("commit:"):
-            header = ["hash", "date", "author", "email", "message"]
-            line = line[7:]
-            reader = csv.reader([line])
-            current_commit = dict(zip(header, next(reader)))
-            current_commit["date"] = dateutil.parser.parse(current_commit["date"])
+def _split_rename(filepath: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits a numstat filepath written in git's rename notation
+    into the old and the new path. Returns None for other paths.
+    """
+    if _RENAME_SEPARATOR not in filepath:
+        return None
 
-            current_commit["committer"] = Committer(
-                current_commit["author"], current_commit["email"]
-            )
-            del current_commit["author"]
-            del current_commit["email"]
-            continue
+    match = _RENAME_IN_BRACES.match(filepath)
+    if match is None:
+        old_path, new_path = filepath.split(_RENAME_SEPARATOR, 1)
+        return old_path, new_path
+
+    prefix, old_part, new_part, suffix = match.groups()
+    return (
+        _join_rename_path(prefix, old_part, suffix),
+        _join_rename_path(prefix, new_part, suffix),
+    )
+
+
+def _resolve_renames(
+    git_file_commits: Iterable[GitFileCommit],
+) -> Iterator[GitFileCommit]:
+    """
+    Rewrites the filepath of every GitFileCommit to the path the file
+    was last renamed to, in a single pass over the log.
+
+    The commits must be ordered newest first, as git log prints them.
+    Every rename that is seen then already knows the final path of its
+    new name, so the index maps each old path straight to it.
+    A path that is reused after its file was renamed away keeps its own
+    history, as its newer rows are seen before the rename.
+    """
+    current_paths: Dict[str, str] = {}
+
+    for file_commit in git_file_commits:
+        rename = _split_rename(file_commit.filepath)
+        if rename is None:
+            current_path = current_paths.get(file_commit.filepath)
+        else:
+            old_path, new_path = rename
+            current_path = current_paths.get(new_path, new_path)
+            current_paths[old_path] = current_path
+
+        if current_path is not None:
+            file_commit = file_commit._replace(filepath=current_path)
+        yield file_commit
+
+
+def _stream_git_log(git_command: List[str]) -> Iterator[str]:
+    """
+    Runs git log and yields its output one line at a time as it
+    is read from the pipe, instead of buffering the whole log.
+    """
+    process = subprocess.Popen(git_command, stdout=subprocess.PIPE, encoding="UTF8")
+    with process:
+        yield from process.stdout
+
+    if process.returncode != 0:
+        raise DataSetError(
+            subprocess.CalledProcessError(process.returncode, git_command)
+        )
 
-        split_lines = line.split("\t")
-        try:
-            current_commit["insertions"] = _parse_change(split_lines[0])
-            current_commit["deletions"] = _parse_change(split_lines[1])
-            current_commit["filepath"] = split_lines[2]
-        except (ValueError, IndexError):
-            raise Exception(f'Can not parse line: "{line}"')
 
-        out_commits.append(GitFileCommit(**current_commit))
-    return out_commits
+def _parse_git_log_shard(
+    git_command: List[str],
+    revisions: List[str],
+    commit_filter: Optional[CommitFilter] = None,
+) -> List[GitFileCommit]:
+    """
+    Runs a git log command reading its revisions from --stdin over exactly
+    the given revisions and parses the output.
+    Used as the unit of work of the process pool.
+    """
+    try:
+        raw_git_output = subprocess.run(
+            git_command,
+            input="\n".join(revisions).encode("UTF8"),
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout.decode("UTF8")
+    except subprocess.CalledProcessError as e:
+        raise DataSetError(e)
+
+    return _parse_git_log_output(raw_git_output, commit_filter)
+
+
+def _split_shards(revisions: List[str], shard_count: int) -> List[List[str]]:
+    """
+    Splits revisions into at most shard_count contiguous shards
+    of near equal size, keeping their order.
+    """
+    shard_size, remainder = divmod(len(revisions), shard_count)
+    shards = []
+    start = 0
+    for shard_index in range(shard_count):
+        end = start + shard_size + (1 if shard_index < remainder else 0)
+        if end > start:
+            shards.append(revisions[start:end])
+        start = end
+    return shards
+
+
+def _run_git(repository: str, *args: str) -> str:
+    try:
+        return (
+            subprocess.check_output(["git", "-C", repository, *args])
+            .decode("UTF8")
+            .strip()
+        )
+    except subprocess.CalledProcessError as e:
+        raise DataSetError(e)
+
+
+def _is_ancestor(repository: str, ancestor: str, descendant: str) -> bool:
+    """
+    Whether ancestor is still part of the history of descendant.
+    This is False after a force-push or rebase dropped the ancestor,
+    or when the ancestor no longer exists in the repository at all.
+    """
+    return_code = subprocess.call(
+        ["git", "-C", repository, "merge-base", "--is-ancestor", ancestor, descendant],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return return_code == 0
+
+
+class _CommitCacheEntry(NamedTuple):
+    """
+    The parsed commits of one repository up to and including head.
+        head: The hash of the last commit that was processed
+        table: The GitFileCommitTable of the commits reachable from head,
+            newest first. Its arrays are pickled as they are, so a load
+            never builds a GitFileCommit per row
+    """
+
+    head: str
+    table: GitFileCommitTable
+
+
+def _read_commit_cache(cache_path: str) -> Dict[Tuple, _CommitCacheEntry]:
+    if not os.path.exists(cache_path):
+        return {}
+    with open(cache_path, "rb") as f:
+        return pickle.load(f)
+
+
+def _write_commit_cache(cache_path: str, cache: Dict[Tuple, _CommitCacheEntry]) -> None:
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    # Write next to the cache and swap it in, so an interrupted
+    # run never leaves a truncated cache behind. The temp file is
+    # unique, so concurrent runs never write to the same one
+    fd, tmp_path = tempfile.mkstemp(
+        dir=cache_dir or None, prefix=os.path.basename(cache_path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
 
 class GitFileCommitDataSet(AbstractVersionedDataSet):
@@ -107,44 +635,276 @@ class GitFileCommitDataSet(AbstractVersionedDataSet):
         filepath: The path to the git repository
         before: The end date of the git logs to gather
         after: The start date of the git logs to gather
+        streaming: Read the git log through a pipe and return an iterator
+            of GitFileCommit tuples instead of a list, so the full log
+            is never held in memory
+        cache_path: A file in which to keep the parsed commits between runs.
+            Later loads only parse the commits added since the cached head,
+            and rebuild the cache when that head was rewritten away.
+            Commits are cached as a GitFileCommitTable, which a columnar
+            load returns as it is. Otherwise a cached load returns a list,
+            with dates in UTC
+        workers: The number of processes used to run git log and parse it.
+            The history is split into contiguous shards of commits which are
+            parsed in parallel and merged back in log order.
+            A parallel load always returns a list
+        columnar: Return a GitFileCommitTable instead of GitFileCommit tuples.
+            Unless cached or parallel, the table is built straight from the
+            git log pipe
+        included_paths: Pathspecs that git log is limited to,
+            e.g. ["src", ":(glob)**/*.py"]
+        excluded_paths: Pathspecs that git log skips, e.g. ["venv", "*.lock"].
+            Entries without pathspec magic are wrapped in :(exclude),
+            and exclude is added to the magic of those without it
+        first_parent: Only follow the first parent of merge commits
+        no_merges: Skip merge commits
+        max_files_per_commit: Skip commits that change more files than this,
+            such as bulk reformatting or vendoring commits
+        excluded_authors: Regular expressions matched against the
+            "name <email>" of each author, e.g. ["\\[bot\\]"].
+            Commits of matching authors are skipped
+        excluded_messages: Regular expressions matched against the summary
+            line of each commit. Matching commits are skipped
+        track_renames: Detect renames with git log -M and report every
+            change under the path the file was last renamed to
+        revision_range: The revisions git log walks instead of HEAD,
+            e.g. "release", "main..release" or "main...release".
+            A cached load needs a single ref
     """
 
+    # Shards handed out per worker, so one slow shard of large
+    # commits does not leave the rest of the pool idle
+    SHARDS_PER_WORKER = 4
+
     def __init__(
         self,
         filepath: PurePath,
         before: Optional[str] = None,
         after: Optional[str] = None,
+        streaming: bool = False,
+        cache_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        columnar: bool = False,
+        included_paths: List[str] = None,
+        excluded_paths: List[str] = None,
+        first_parent: bool = False,
+        no_merges: bool = False,
+        max_files_per_commit: Optional[int] = None,
+        excluded_authors: List[str] = None,
+        excluded_messages: List[str] = None,
+        track_renames: bool = False,
+        revision_range: Optional[str] = None,
         *args,
         **kwargs,
     ):
         super().__init__(filepath, version=None, *args, **kwargs)
         self._before = before
         self._after = after
+        self._streaming = streaming
+        self._cache_path = cache_path
+        self._workers = workers
+        self._columnar = columnar
+        self._included_paths = included_paths or []
+        self._excluded_paths = excluded_paths or []
+        self._first_parent = first_parent
+        self._no_merges = no_merges
+        self._max_files_per_commit = max_files_per_commit
+        self._excluded_authors = excluded_authors or []
+        self._excluded_messages = excluded_messages or []
+        self._track_renames = track_renames
+        self._revision_range = revision_range
+
+        self._commit_filter = None
+        if max_files_per_commit or excluded_authors or excluded_messages:
+            self._commit_filter = CommitFilter(
+                max_files_per_commit,
+                _compile_patterns(self._excluded_authors),
+                _compile_patterns(self._excluded_messages),
+            )
 
     def _describe(self) -> Dict[str, Any]:
-        return dict(filepath=self._filepath, before=self._before, after=self._after)
+        return dict(
+            filepath=self._filepath,
+            before=self._before,
+            after=self._after,
+            streaming=self._streaming,
+            cache_path=self._cache_path,
+            workers=self._workers,
+            columnar=self._columnar,
+            included_paths=self._included_paths,
+            excluded_paths=self._excluded_paths,
+            first_parent=self._first_parent,
+            no_merges=self._no_merges,
+            max_files_per_commit=self._max_files_per_commit,
+            excluded_authors=self._excluded_authors,
+            excluded_messages=self._excluded_messages,
+            track_renames=self._track_renames,
+            revision_range=self._revision_range,
+        )
 
     def _save(self, data: Any) -> None:
         raise ReadOnlyDataSet()
 
-    def _load(self) -> List[GitFileCommit]:
+    def _git_revision_filters(self) -> List[str]:
+        revision_filters = []
+
+        if type(self._before) is datetime.date:
+            revision_filters.append(f"--before={self._before}")
+        if type(self._after) is datetime.date:
+            revision_filters.append(f"--after={self._after}")
+        if self._first_parent:
+            revision_filters.append("--first-parent")
+        if self._no_merges:
+            revision_filters.append("--no-merges")
+
+        return revision_filters
+
+    def _git_pathspecs(self) -> List[str]:
+        pathspecs = list(self._included_paths)
+
+        if self._excluded_paths:
+            # Exclusions need something to be excluded from,
+            # so start from the whole tree when nothing is included
+            if not pathspecs:
+                pathspecs.append(":/")
+            pathspecs.extend(_exclude_pathspec(path) for path in self._excluded_paths)
+
+        if not pathspecs:
+            return []
+        return ["--", *pathspecs]
+
+    def _git_log_command(self, *revision_args: str) -> List[str]:
+        return [
+            "git",
+            "-C",
+            self._filepath,
+            "log",
+            GIT_LOG_FORMAT,
+            "--numstat",
+            *(["-M"] if self._track_renames else []),
+            *self._git_revision_filters(),
+            *revision_args,
+            *self._git_pathspecs(),
+        ]
+
+    def _cache_key(self) -> Tuple:
+        # Every option that changes which rows git log produces
+        # must be part of the key, so differently configured
+        # datasets can share one cache file
+        return (
+            os.path.abspath(self._filepath),
+            self._before,
+            self._after,
+            tuple(self._included_paths),
+            tuple(self._excluded_paths),
+            self._first_parent,
+            self._no_merges,
+            self._max_files_per_commit,
+            tuple(self._excluded_authors),
+            tuple(self._excluded_messages),
+            self._track_renames,
+            self._revision_range,
+        )
+
+    def _is_parallel(self) -> bool:
+        return self._workers is not None and self._workers > 1
+
+    def _parse_git_log_parallel(
+        self, revision_range: Optional[str] = None
+    ) -> List[GitFileCommit]:
+        revisions = _run_git(
+            self._filepath,
+            "rev-list",
+            *self._git_revision_filters(),
+            revision_range or "HEAD",
+            *self._git_pathspecs(),
+        ).split()
+        shards = _split_shards(revisions, self._workers * self.SHARDS_PER_WORKER)
+        git_command = self._git_log_command("--no-walk=unsorted", "--stdin")
+
+        commits = []
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            parsed_shards = executor.map(
+                _parse_git_log_shard,
+                [git_command] * len(shards),
+                shards,
+                [self._commit_filter] * len(shards),
+            )
+            for parsed_shard in parsed_shards:
+                commits.extend(parsed_shard)
+        return commits
+
+    def _parse_git_log(
+        self, revision_range: Optional[str] = None
+    ) -> List[GitFileCommit]:
+        if self._is_parallel():
+            return self._parse_git_log_parallel(revision_range)
+
+        revision_args = [] if revision_range is None else [revision_range]
         try:
-            git_command = [
-                "git",
-                "-C",
-                self._filepath,
-                "log",
-                '--pretty=format:commit:%H,%cI,"%an",%ae,"%s"',
-                "--numstat",
-            ]
-
-            if type(self._before) is datetime.date:
-                git_command.append(f"--before={self._before}")
-            if type(self._after) is datetime.date:
-                git_command.append(f"--after={self._after}")
-
-            raw_git_output = subprocess.check_output(git_command).decode("UTF8")
+            raw_git_output = subprocess.check_output(
+                self._git_log_command(*revision_args)
+            ).decode("UTF8")
         except subprocess.CalledProcessError as e:
             raise DataSetError(e)
 
-        return _parse_git_log_output(raw_git_output)
+        return _parse_git_log_output(raw_git_output, self._commit_filter)
+
+    def _load_cached(self) -> GitFileCommitTable:
+        head = _run_git(
+            self._filepath,
+            "rev-parse",
+            "--verify",
+            f"{self._revision_range or 'HEAD'}^{{commit}}",
+        )
+        cache = _read_commit_cache(self._cache_path)
+        cache_key = self._cache_key()
+        entry = cache.get(cache_key)
+        if entry is not None and not isinstance(entry.table, GitFileCommitTable):
+            # Written by a version that cached GitFileCommit tuples
+            entry = None
+
+        if entry is not None and entry.head == head:
+            return entry.table
+
+        if entry is not None and _is_ancestor(self._filepath, entry.head, head):
+            # git log lists the newest commits first
+            new_commits = self._parse_git_log(f"{entry.head}..{head}")
+            table = GitFileCommitTable.concatenate(
+                [GitFileCommitTable.from_commits(new_commits), entry.table]
+            )
+        else:
+            table = GitFileCommitTable.from_commits(self._parse_git_log(head))
+
+        cache[cache_key] = _CommitCacheEntry(head, table)
+        _write_commit_cache(self._cache_path, cache)
+        return table
+
+    def _load(
+        self,
+    ) -> Union[List[GitFileCommit], Iterator[GitFileCommit], GitFileCommitTable]:
+        if self._cache_path is not None:
+            table = self._load_cached()
+            if self._columnar and not self._track_renames:
+                return table
+            git_file_commits = list(table.to_commits())
+        elif (self._streaming or self._columnar) and not self._is_parallel():
+            revision_args = [self._revision_range] if self._revision_range else []
+            git_file_commits = _iter_git_file_commits(
+                _stream_git_log(self._git_log_command(*revision_args)),
+                self._commit_filter,
+            )
+        else:
+            git_file_commits = self._parse_git_log(self._revision_range)
+
+        if self._track_renames:
+            resolved_commits = _resolve_renames(git_file_commits)
+            git_file_commits = (
+                resolved_commits
+                if isinstance(git_file_commits, Iterator)
+                else list(resolved_commits)
+            )
+
+        if self._columnar:
+            return GitFileCommitTable.from_commits(git_file_commits)
+        return git_file_commits
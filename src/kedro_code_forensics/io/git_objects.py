@@ -0,0 +1,197 @@
+import os
+import subprocess
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from kedro.io import DataSetError
+
+
+def _git_output(repository: str, *args: str, stdin: bytes = None) -> bytes:
+    try:
+        return subprocess.run(
+            ["git", "-C", repository, *args],
+            input=stdin,
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise DataSetError(e)
+
+
+def _split_nul(raw_output: bytes) -> List[str]:
+    return [entry for entry in raw_output.decode("UTF8").split("\0") if entry]
+
+
+def tracked_files(repository: str) -> List[str]:
+    """
+    Lists the files git tracks under repository, relative to it.
+    Files outside a sparse checkout, or deleted from the working tree,
+    are left out, as there is nothing on disk to read.
+    """
+    filepaths = []
+    # -t prefixes every path with a status tag, "S " for skip-worktree
+    for entry in _split_nul(_git_output(repository, "ls-files", "-z", "-t")):
+        tag, filepath = entry.split(" ", 1)
+        if tag != "S" and os.path.isfile(os.path.join(repository, filepath)):
+            filepaths.append(filepath)
+    return filepaths
+
+
+def working_tree_blob_ids(repository: str, filepaths: List[str]) -> Dict[str, str]:
+    """
+    Returns the git blob id of the current content of each of filepaths,
+    relative to repository.
+
+    Files that are tracked and unchanged take their id from the index,
+    via git ls-files -s, without being read. Only modified and untracked
+    files are hashed with git hash-object.
+    """
+    index_blob_ids = {}
+    for entry in _split_nul(_git_output(repository, "ls-files", "-s", "-z")):
+        # <mode> <blob id> <stage>\t<filepath>
+        info, filepath = entry.split("\t", 1)
+        _, blob_id, stage = info.split(" ")
+        if stage == "0":
+            index_blob_ids[filepath] = blob_id
+
+    modified = set(_split_nul(_git_output(repository, "ls-files", "-m", "-z")))
+
+    blob_ids = {}
+    to_hash = []
+    for filepath in filepaths:
+        blob_id = index_blob_ids.get(filepath)
+        if blob_id is None or filepath in modified:
+            to_hash.append(filepath)
+        else:
+            blob_ids[filepath] = blob_id
+
+    if to_hash:
+        hashed = _git_output(
+            repository,
+            "hash-object",
+            "--stdin-paths",
+            stdin="\n".join(to_hash).encode("UTF8"),
+        )
+        blob_ids.update(zip(to_hash, hashed.decode("UTF8").split()))
+
+    return blob_ids
+
+
+def tree_blob_ids(repository: str, ref: str) -> Dict[str, str]:
+    """
+    Returns the git blob id of every file in the tree of ref,
+    such as a tag, branch or commit, keyed by its path.
+    Submodules and symbolic links are left out.
+    """
+    blob_ids = {}
+    for entry in _split_nul(_git_output(repository, "ls-tree", "-r", "-z", ref)):
+        # <mode> <type> <blob id>\t<filepath>
+        info, filepath = entry.split("\t", 1)
+        mode, object_type, blob_id = info.split(" ")
+        if object_type == "blob" and mode != "120000":
+            blob_ids[filepath] = blob_id
+    return blob_ids
+
+
+def resolve_blob_ids(repository: str, object_names: List[str]) -> List[Optional[str]]:
+    """
+    Resolves object names such as <commit>:<filepath> to blob ids in one
+    git cat-file --batch-check call. Names that do not resolve to a blob,
+    such as a file that was deleted in that commit, give None.
+    """
+    if not object_names:
+        return []
+
+    output = _git_output(
+        repository,
+        "cat-file",
+        "--batch-check",
+        stdin="".join(f"{name}\n" for name in object_names).encode("UTF8"),
+    )
+
+    blob_ids: List[Optional[str]] = []
+    # <blob id> <type> <size>, or <object name> missing
+    for line in output.decode("UTF8").splitlines():
+        parts = line.rsplit(" ", 2)
+        if len(parts) == 3 and parts[1] == "blob" and parts[2].isdigit():
+            blob_ids.append(parts[0])
+        else:
+            blob_ids.append(None)
+    return blob_ids
+
+
+class BlobReader:
+    """
+    BlobReader reads the content of blobs straight from the object
+    database of a repository, through a single git cat-file --batch
+    process that is kept open for the lifetime of the reader.
+
+    Blob ids are written to git from a separate thread while the content
+    is read back, so requests and responses are pipelined rather than
+    paying a round trip per blob.
+
+    Args:
+        repository: The path of the git repository
+    """
+
+    def __init__(self, repository: str):
+        self._process = subprocess.Popen(
+            ["git", "-C", repository, "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> "BlobReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._process.stdin.close()
+        self._process.stdout.close()
+        self._process.wait()
+
+    def _write_blob_ids(self, blob_ids: List[str]) -> None:
+        try:
+            for blob_id in blob_ids:
+                self._process.stdin.write(f"{blob_id}\n".encode("ascii"))
+            self._process.stdin.flush()
+        except BrokenPipeError:
+            # git exited, which the reading side reports
+            pass
+
+    def _read_object(self) -> Tuple[List[bytes], Optional[bytes]]:
+        # <blob id> <type> <size>\n<content>\n, or <blob id> missing\n
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            return header, None
+        content = self._process.stdout.read(int(header[2]))
+        self._process.stdout.read(1)
+        return header, content
+
+    def iter_blobs(self, blob_ids: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yields (blob id, content) for each of blob_ids, in order.
+        Raises a DataSetError for an id that is not a blob in the repository.
+        """
+        blob_ids = list(blob_ids)
+        writer = threading.Thread(target=self._write_blob_ids, args=(blob_ids,))
+        writer.start()
+
+        unread = len(blob_ids)
+        try:
+            for blob_id in blob_ids:
+                header, content = self._read_object()
+                unread -= 1
+                if not header:
+                    raise DataSetError("git cat-file exited before reading all blobs")
+                if content is None or header[1] != b"blob":
+                    raise DataSetError(f"{blob_id} is not a blob in the repository")
+                yield blob_id, content
+        finally:
+            # Responses left unread would be taken for those of the next call
+            for _ in range(unread):
+                if not self._read_object()[0]:
+                    break
+            writer.join()
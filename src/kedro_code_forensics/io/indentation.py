@@ -0,0 +1,135 @@
+from pathlib import PurePath
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+from kedro.io import AbstractVersionedDataSet
+
+from kedro_code_forensics.io.expections import ReadOnlyDataSet
+from kedro_code_forensics.io.line_counter import (
+    DEFAULT_EXCLUDED_DIRS,
+    map_files,
+    select_files,
+)
+
+
+class IndentationComplexity(NamedTuple):
+    """
+    IndentationComplexity measures the shape of a file's code through its
+    indentation, a language neutral proxy for complexity.
+    Indentation is counted in logical levels: a tab, or tab_size spaces,
+    is one level. Blank lines are left out.
+        lines: The number of lines in the file
+        total: The sum of the indentation levels of all non-blank lines
+        mean: The mean indentation level of the non-blank lines
+        max: The deepest indentation level
+        sd: The standard deviation of the indentation levels
+    """
+
+    lines: int
+    total: float
+    mean: float
+    max: float
+    sd: float
+
+
+_NEWLINE, _TAB, _SPACE, _CARRIAGE_RETURN = b"\n\t \r"
+
+
+def indentation_complexity(content: bytes, tab_size: int = 4) -> IndentationComplexity:
+    """
+    Measures the indentation of content without a Python loop over its lines.
+    The positions of newlines, tabs, spaces and the first character
+    of code are found with NumPy over the whole buffer, and each line's
+    indentation is the tabs and spaces between its start and its code.
+    """
+    data = np.frombuffer(content, dtype=np.uint8)
+    newlines = np.flatnonzero(data == _NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(data)]))
+    if len(data) == 0 or data[-1] == _NEWLINE:
+        # No line follows the final newline
+        starts, ends = starts[:-1], ends[:-1]
+
+    is_tab = data == _TAB
+    is_indentation = is_tab | (data == _SPACE)
+    code = np.flatnonzero(
+        ~(is_indentation | (data == _NEWLINE) | (data == _CARRIAGE_RETURN))
+    )
+    # The first character of code at or after the start of each line,
+    # which for a blank line lies beyond its end
+    first_code = np.searchsorted(code, starts)
+    code_starts = np.append(code, len(data))[first_code]
+    non_blank = code_starts < ends
+    starts, code_starts = starts[non_blank], code_starts[non_blank]
+
+    if len(starts) == 0:
+        return IndentationComplexity(len(ends), 0.0, 0.0, 0.0, 0.0)
+
+    # Whitespace after the indentation is not counted, so each line is
+    # measured up to its first character that is not a tab or a space
+    not_indentation = np.flatnonzero(~is_indentation)
+    indentation_ends = not_indentation[np.searchsorted(not_indentation, starts)]
+
+    tabs = np.flatnonzero(is_tab)
+    tab_counts = np.searchsorted(tabs, indentation_ends) - np.searchsorted(tabs, starts)
+    space_counts = indentation_ends - starts - tab_counts
+    levels = tab_counts + space_counts / tab_size
+
+    return IndentationComplexity(
+        len(ends),
+        float(levels.sum()),
+        float(levels.mean()),
+        float(levels.max()),
+        float(levels.std()),
+    )
+
+
+def measure_file(filepath: str, tab_size: int = 4) -> IndentationComplexity:
+    with open(filepath, "rb") as f:
+        return indentation_complexity(f.read(), tab_size)
+
+
+class IndentationComplexityDataSet(AbstractVersionedDataSet):
+    """
+    IndentationComplexityDataSet returns the IndentationComplexity of
+    each file in a known language found in the specified filepath,
+    keyed by its path relative to filepath.
+    Files are measured in a pool of processes.
+    Args:
+        filepath: The path to the directory that we will be measuring
+        excluded_dirs: A list of directories that we will be excluding
+        tracked_only: Only measure the files git tracks, as listed by
+            git ls-files, instead of walking the whole directory
+        workers: The number of processes used. Defaults to the number of CPUs
+    """
+
+    def __init__(
+        self,
+        filepath: PurePath,
+        excluded_dirs: List[str] = None,
+        tracked_only: bool = False,
+        workers: Optional[int] = None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(filepath, version=None, *args, **kwargs)
+        self._excluded_dirs = excluded_dirs or DEFAULT_EXCLUDED_DIRS
+        self._tracked_only = tracked_only
+        self._workers = workers
+
+    def _load(self) -> Dict[str, IndentationComplexity]:
+        filepaths = select_files(
+            self._filepath, self._excluded_dirs, self._tracked_only
+        )
+        return dict(map_files(measure_file, self._filepath, filepaths, self._workers))
+
+    def _save(self, data: Any) -> None:
+        raise ReadOnlyDataSet()
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            excluded_dirs=self._excluded_dirs,
+            tracked_only=self._tracked_only,
+            workers=self._workers,
+        )
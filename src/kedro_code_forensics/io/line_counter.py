@@ -0,0 +1,300 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from kedro_code_forensics.io.git_objects import tracked_files
+
+T = TypeVar("T")
+
+
+class LanguageSyntax(NamedTuple):
+    """
+    LanguageSyntax is the comment syntax the line counter recognises
+    for one language.
+        name: The name of the language, as cloc reports it
+        line_comments: The prefixes that start a comment line
+        block_comments: The (start, end) delimiters of block comments
+    """
+
+    name: str
+    line_comments: Tuple[bytes, ...] = ()
+    block_comments: Tuple[Tuple[bytes, bytes], ...] = ()
+
+
+class LineCount(NamedTuple):
+    """
+    LineCount is the classification of the lines of a single file.
+        blank: The number of blank lines
+        comment: The number of comment lines
+        code: The number of code lines
+        language: The language of the code file
+    """
+
+    blank: int
+    comment: int
+    code: int
+    language: str
+
+
+_C_STYLE = ((b"//",), ((b"/*", b"*/"),))
+_HASH_STYLE = ((b"#",), ())
+_MARKUP_STYLE = ((), ((b"<!--", b"-->"),))
+
+LANGUAGES: Dict[str, LanguageSyntax] = {
+    ".py": LanguageSyntax("Python", (b"#",), ((b'"""', b'"""'), (b"'''", b"'''"))),
+    ".pyx": LanguageSyntax("Cython", (b"#",), ((b'"""', b'"""'),)),
+    ".js": LanguageSyntax("JavaScript", *_C_STYLE),
+    ".jsx": LanguageSyntax("JSX", *_C_STYLE),
+    ".ts": LanguageSyntax("TypeScript", *_C_STYLE),
+    ".tsx": LanguageSyntax("TypeScript", *_C_STYLE),
+    ".java": LanguageSyntax("Java", *_C_STYLE),
+    ".scala": LanguageSyntax("Scala", *_C_STYLE),
+    ".kt": LanguageSyntax("Kotlin", *_C_STYLE),
+    ".swift": LanguageSyntax("Swift", *_C_STYLE),
+    ".go": LanguageSyntax("Go", *_C_STYLE),
+    ".rs": LanguageSyntax("Rust", *_C_STYLE),
+    ".c": LanguageSyntax("C", *_C_STYLE),
+    ".h": LanguageSyntax("C/C++ Header", *_C_STYLE),
+    ".hpp": LanguageSyntax("C/C++ Header", *_C_STYLE),
+    ".cc": LanguageSyntax("C++", *_C_STYLE),
+    ".cpp": LanguageSyntax("C++", *_C_STYLE),
+    ".cxx": LanguageSyntax("C++", *_C_STYLE),
+    ".cs": LanguageSyntax("C#", *_C_STYLE),
+    ".php": LanguageSyntax("PHP", (b"//", b"#"), ((b"/*", b"*/"),)),
+    ".css": LanguageSyntax("CSS", (), ((b"/*", b"*/"),)),
+    ".scss": LanguageSyntax("SCSS", *_C_STYLE),
+    ".rb": LanguageSyntax("Ruby", (b"#",), ((b"=begin", b"=end"),)),
+    ".sh": LanguageSyntax("Bourne Shell", *_HASH_STYLE),
+    ".bash": LanguageSyntax("Bourne Again Shell", *_HASH_STYLE),
+    ".r": LanguageSyntax("R", *_HASH_STYLE),
+    ".pl": LanguageSyntax("Perl", *_HASH_STYLE),
+    ".yml": LanguageSyntax("YAML", *_HASH_STYLE),
+    ".yaml": LanguageSyntax("YAML", *_HASH_STYLE),
+    ".toml": LanguageSyntax("TOML", *_HASH_STYLE),
+    ".ini": LanguageSyntax("INI", (b";", b"#")),
+    ".sql": LanguageSyntax("SQL", (b"--",), ((b"/*", b"*/"),)),
+    ".json": LanguageSyntax("JSON"),
+    ".md": LanguageSyntax("Markdown", *_MARKUP_STYLE),
+    ".html": LanguageSyntax("HTML", *_MARKUP_STYLE),
+    ".htm": LanguageSyntax("HTML", *_MARKUP_STYLE),
+    ".xml": LanguageSyntax("XML", *_MARKUP_STYLE),
+}
+
+# Version control directories that cloc also never counts
+ALWAYS_EXCLUDED_DIRS = {".git", ".hg", ".svn", ".bzr", ".cvs"}
+
+# Directories skipped when a dataset is given no excluded_dirs
+DEFAULT_EXCLUDED_DIRS = ["venv"]
+
+
+def language_of(filepath: str) -> Optional[LanguageSyntax]:
+    _, ext = os.path.splitext(filepath)
+    return LANGUAGES.get(ext.lower())
+
+
+def _unclosed_block(
+    line: bytes, block_comments: Tuple[Tuple[bytes, bytes], ...]
+) -> Optional[bytes]:
+    """
+    Finds the block comments and strings opened on a line, in order, and
+    returns the end delimiter of the one left open, or None if all closed.
+    """
+    position = 0
+    while True:
+        openings = [
+            (line.find(start, position), start, end) for start, end in block_comments
+        ]
+        openings = [opening for opening in openings if opening[0] >= 0]
+        if not openings:
+            return None
+
+        index, start, end = min(openings)
+        close = line.find(end, index + len(start))
+        if close < 0:
+            return end
+        position = close + len(end)
+
+
+def count_line_kinds(lines: Iterable[bytes], syntax: LanguageSyntax) -> LineCount:
+    """
+    Classifies lines as blank, comment or code.
+    A line is a comment only when it starts with a comment,
+    so code followed by a trailing comment counts as code, as in cloc.
+    Lines inside a block, including a multi-line string opened after code,
+    are comments, except blank ones, as in cloc. The delimiter that
+    closes a block is never read as opening another.
+    """
+    blank = comment = code = 0
+    block_end = None
+
+    for line in lines:
+        line = line.strip()
+
+        if block_end is not None:
+            if not line:
+                blank += 1
+                continue
+            comment += 1
+            close = line.find(block_end)
+            if close >= 0:
+                block_end = _unclosed_block(
+                    line[close + len(block_end) :], syntax.block_comments
+                )
+            continue
+
+        if not line:
+            blank += 1
+            continue
+
+        if syntax.line_comments and line.startswith(syntax.line_comments):
+            comment += 1
+            continue
+
+        if not syntax.block_comments:
+            code += 1
+            continue
+
+        if any(line.startswith(start) for start, _ in syntax.block_comments):
+            comment += 1
+        else:
+            code += 1
+        block_end = _unclosed_block(line, syntax.block_comments)
+
+    return LineCount(blank, comment, code, syntax.name)
+
+
+def count_file(filepath: str) -> Optional[LineCount]:
+    """
+    Counts the lines of one file, reading it through mmap.
+    Returns None for files in an unknown language, for empty files and
+    for files that cannot be read, such as dangling symlinks,
+    which cloc skips as well.
+    """
+    syntax = language_of(filepath)
+    if syntax is None:
+        return None
+
+    try:
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return count_line_kinds(iter(mapped.readline, b""), syntax)
+    except OSError:
+        return None
+
+
+def count_blob(filepath: str, content: bytes) -> Optional[LineCount]:
+    """
+    Counts the lines of the in-memory content of the file at filepath,
+    such as a blob read from the git object database.
+    Returns None for files in an unknown language and for empty files.
+    """
+    syntax = language_of(filepath)
+    if syntax is None or not content:
+        return None
+    # Lines end only at a newline, as in count_file, whose counts are
+    # cached under the same blob ids. splitlines would also break
+    # on a bare carriage return or a form feed
+    lines = content.split(b"\n")
+    if not lines[-1]:
+        # No line follows a final newline
+        lines.pop()
+    return count_line_kinds(lines, syntax)
+
+
+def filter_files(
+    filepaths: Iterable[str], excluded_dirs: List[str], known_languages_only: bool
+) -> Iterator[str]:
+    """
+    Yields the filepaths that are not inside a directory named in
+    excluded_dirs and, if known_languages_only, are in a known language.
+    """
+    excluded = ALWAYS_EXCLUDED_DIRS.union(excluded_dirs)
+    for filepath in filepaths:
+        dirnames = filepath.split("/")[:-1]
+        if excluded.isdisjoint(dirnames) and (
+            not known_languages_only or language_of(filepath) is not None
+        ):
+            yield filepath
+
+
+def walk_files(
+    root: str, excluded_dirs: List[str], known_languages_only: bool = True
+) -> Iterator[str]:
+    """
+    Yields the paths, relative to root, of the files in a known language,
+    or of all files when known_languages_only is False,
+    skipping any directory whose name is in excluded_dirs.
+    """
+    excluded = ALWAYS_EXCLUDED_DIRS.union(excluded_dirs)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [dirname for dirname in dirnames if dirname not in excluded]
+        for filename in filenames:
+            if not known_languages_only or language_of(filename) is not None:
+                yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
+def select_files(
+    root: str,
+    excluded_dirs: List[str],
+    tracked_only: bool,
+    known_languages_only: bool = True,
+) -> List[str]:
+    """
+    Lists the files under root, relative to it, that a dataset reads:
+    the files git tracks if tracked_only, otherwise every file on disk,
+    less those inside a directory named in excluded_dirs and,
+    if known_languages_only, those in an unknown language.
+    """
+    if tracked_only:
+        filepaths = filter_files(
+            tracked_files(root), excluded_dirs, known_languages_only
+        )
+    else:
+        filepaths = walk_files(root, excluded_dirs, known_languages_only)
+    return list(filepaths)
+
+
+def map_files(
+    function: Callable[[str], Optional[T]],
+    root: str,
+    filepaths: Iterable[str],
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, T]]:
+    """
+    Applies function to the full path of each of filepaths, relative to root,
+    in a pool of processes. Yields (filepath, result) for every file
+    whose result is not None.
+    """
+    filepaths = list(filepaths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            function,
+            [os.path.join(root, filepath) for filepath in filepaths],
+            chunksize=64,
+        )
+        for filepath, result in zip(filepaths, results):
+            if result is not None:
+                yield filepath, result
+
+
+def count_files(
+    root: str, filepaths: Iterable[str], workers: Optional[int] = None
+) -> Iterator[Tuple[str, LineCount]]:
+    """
+    Counts the lines of filepaths, relative to root, in a pool of processes.
+    Yields (filepath, LineCount) for every file that could be counted.
+    """
+    return map_files(count_file, root, filepaths, workers)
@@ -0,0 +1,112 @@
+import posixpath
+from typing import Iterable, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+from kedro_code_forensics.io.git_file_commit import (
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+
+# The average length of a month, in seconds
+SECONDS_PER_MONTH = 365.25 / 12 * 24 * 60 * 60
+
+
+class CodeAge(NamedTuple):
+    """
+    The age of a file: how long ago it last changed.
+        filepath: The path to the file in question
+        last_changed: The date of the last commit to the file,
+            in seconds since the epoch
+        age_months: The months between that commit and the newest in the log
+    """
+
+    filepath: str
+    last_changed: int
+    age_months: float
+
+
+class DirectoryCodeAge(NamedTuple):
+    """
+    The distribution of the age, in months, of the files in a directory.
+        directory: The path to the directory, "." for the root
+        files: The number of files directly in the directory
+        youngest: The age of the most recently changed file
+        lower_quartile: The 25th percentile of the ages
+        median: The median age
+        upper_quartile: The 75th percentile of the ages
+        oldest: The age of the least recently changed file
+    """
+
+    directory: str
+    files: int
+    youngest: float
+    lower_quartile: float
+    median: float
+    upper_quartile: float
+    oldest: float
+
+
+def generate_code_age(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+) -> List[CodeAge]:
+    """
+    Generates the age of every file in the git log, measured from the newest
+    commit in the log so the result does not depend on when it is run.
+    The last change of each file is a group-by maximum over the epoch
+    timestamps of a GitFileCommitTable, so no datetime is kept per row.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :return: List[CodeAge] ordered by age, youngest first
+    """
+    table = as_git_file_commit_table(git_file_commits)
+
+    if len(table.timestamps) == 0:
+        return []
+
+    last_changed = np.full(len(table.filepaths), np.iinfo(np.int64).min)
+    np.maximum.at(last_changed, table.filepath_ids, table.timestamps)
+    age_months = (table.timestamps.max() - last_changed) / SECONDS_PER_MONTH
+
+    order = np.argsort(age_months, kind="stable")
+    return [
+        CodeAge(table.filepaths[file], file_last_changed, file_age_months)
+        for file, file_last_changed, file_age_months in zip(
+            order.tolist(), last_changed[order].tolist(), age_months[order].tolist()
+        )
+    ]
+
+
+def generate_directory_code_age(code_ages: List[CodeAge]) -> List[DirectoryCodeAge]:
+    """
+    Generates the distribution of the age of the files directly
+    in each directory, from the ages generate_code_age returns.
+
+    :param code_ages: List[CodeAge]
+    :return: List[DirectoryCodeAge] ordered by directory
+    """
+    if not code_ages:
+        return []
+
+    ages = pd.Series(
+        [code_age.age_months for code_age in code_ages],
+        index=pd.Index(
+            [posixpath.dirname(code_age.filepath) or "." for code_age in code_ages],
+            name="directory",
+        ),
+    ).groupby(level=0)
+    distribution = pd.concat(
+        [
+            ages.size(),
+            ages.min(),
+            ages.quantile(0.25),
+            ages.median(),
+            ages.quantile(0.75),
+            ages.max(),
+        ],
+        axis=1,
+    )
+
+    return [DirectoryCodeAge(*row) for row in distribution.itertuples(name=None)]
@@ -0,0 +1,172 @@
+import posixpath
+from datetime import date
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from kedro_code_forensics.io.git_file_commit import (
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+from kedro_code_forensics.nodes.periods import period_indexes, period_starts
+
+
+class ChurnPoint(NamedTuple):
+    """
+    The churn of a file or directory during one week or month.
+        path: The path to the file or directory
+        period: The first day of the week, a Monday, or of the month
+        revisions: The number of commits to it during the period
+        insertions: The sum of the insertions during the period
+        deletions: The sum of the deletions during the period
+        trend: The least squares slope of the churned lines, insertions
+            plus deletions, over the window of periods ending with this one,
+            with periods without commits counted as no churn.
+            Positive while it heats up, negative while it cools down
+    """
+
+    path: str
+    period: date
+    revisions: int
+    insertions: int
+    deletions: int
+    trend: float
+
+
+def _rolling_slopes(
+    keys: np.ndarray, periods: np.ndarray, values: np.ndarray, window: int
+) -> np.ndarray:
+    """
+    Computes the least squares slope of values over the window periods
+    ending at each row. Rows are sorted by key, an entity id times the
+    number of periods plus the period, so an entity's rows are contiguous.
+    Window sums come from prefix sums and a binary search for the first
+    row in each window, so periods without rows are never materialised.
+    """
+    prefix_y = np.concatenate(([0.0], np.cumsum(values)))
+    prefix_xy = np.concatenate(([0.0], np.cumsum(periods * values)))
+
+    first_periods = np.maximum(periods - (window - 1), 0)
+    firsts = np.searchsorted(keys, keys - (periods - first_periods))
+    rows = np.arange(len(keys)) + 1
+    sum_y = prefix_y[rows] - prefix_y[firsts]
+    sum_xy = prefix_xy[rows] - prefix_xy[firsts]
+
+    # Every period of the window counts, with or without commits
+    n = (periods - first_periods + 1).astype(np.float64)
+    sum_x = (first_periods + periods) * n / 2
+    sum_xx = (
+        periods * (periods + 1) * (2 * periods + 1)
+        - (first_periods - 1) * first_periods * (2 * first_periods - 1)
+    ) / 6
+
+    denominator = n * sum_xx - sum_x**2
+    return np.divide(
+        n * sum_xy - sum_x * sum_y,
+        denominator,
+        out=np.zeros(len(keys)),
+        where=denominator > 0,
+    )
+
+
+def _generate_churn(
+    table: GitFileCommitTable,
+    entity_ids: np.ndarray,
+    entity_names: List[str],
+    period: str,
+    window: int,
+) -> List[ChurnPoint]:
+    if len(table.timestamps) == 0:
+        return []
+
+    indexes = period_indexes(table.timestamps, period)
+    first_period = indexes.min()
+    periods = indexes - first_period
+    period_count = int(periods.max()) + 1
+
+    # One sort groups the rows by entity, then period
+    keys, row_keys = np.unique(
+        entity_ids.astype(np.int64) * period_count + periods, return_inverse=True
+    )
+    # A commit that changes several files of a directory is one revision
+    commit_count = len(table.hashes)
+    key_commits = np.unique(row_keys.astype(np.int64) * commit_count + table.commit_ids)
+    revisions = np.bincount(key_commits // commit_count, minlength=len(keys))
+    insertions = np.bincount(row_keys, weights=table.insertions).astype(np.int64)
+    deletions = np.bincount(row_keys, weights=table.deletions).astype(np.int64)
+
+    entities, key_periods = np.divmod(keys, period_count)
+    trends = _rolling_slopes(
+        keys, key_periods, (insertions + deletions).astype(np.float64), window
+    )
+
+    return [
+        ChurnPoint(entity_names[entity], period_start, *churn)
+        for entity, period_start, *churn in zip(
+            entities.tolist(),
+            period_starts(key_periods + first_period, period),
+            revisions.tolist(),
+            insertions.tolist(),
+            deletions.tolist(),
+            trends.tolist(),
+        )
+    ]
+
+
+def _directory_ids(filepaths: List[str]) -> Tuple[np.ndarray, List[str]]:
+    directory_index = {}
+    file_directories = np.array(
+        [
+            directory_index.setdefault(
+                posixpath.dirname(filepath) or ".", len(directory_index)
+            )
+            for filepath in filepaths
+        ],
+        dtype=np.int64,
+    )
+    return file_directories, list(directory_index)
+
+
+def generate_file_churn(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    period: str,
+    window: int,
+) -> List[ChurnPoint]:
+    """
+    Generates the weekly or monthly churn of every file, with the trend
+    of its churn over a rolling window of periods, so hot spots that are
+    heating up can be told from those cooling down.
+    Rows are bucketed from their epoch timestamps and summed after a single
+    sort, for every period in one pass rather than one run per window.
+    Only periods in which a file changed are listed.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param period: "week" or "month"
+    :param window: The number of periods the trend is fitted over
+    :return: List[ChurnPoint] grouped by file, ordered by period
+    """
+    table = as_git_file_commit_table(git_file_commits)
+    return _generate_churn(table, table.filepath_ids, table.filepaths, period, window)
+
+
+def generate_directory_churn(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    period: str,
+    window: int,
+) -> List[ChurnPoint]:
+    """
+    Generates the weekly or monthly churn of the files directly in each
+    directory, as generate_file_churn does for files.
+    The root directory is ".".
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param period: "week" or "month"
+    :param window: The number of periods the trend is fitted over
+    :return: List[ChurnPoint] grouped by directory, ordered by period
+    """
+    table = as_git_file_commit_table(git_file_commits)
+    file_directories, directories = _directory_ids(table.filepaths)
+    return _generate_churn(
+        table, file_directories[table.filepath_ids], directories, period, window
+    )
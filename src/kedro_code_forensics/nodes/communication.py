@@ -0,0 +1,104 @@
+from typing import Iterable, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+
+
+class AuthorCommunication(NamedTuple):
+    """
+    An edge of the developer communication graph:
+    two authors who changed the same files.
+        author: The first author
+        peer: The author they share files with
+        shared_files: The number of files both authors changed
+        strength: The shared files as a percentage of
+            the average number of files each of the two authors changed
+    """
+
+    author: Committer
+    peer: Committer
+    shared_files: int
+    strength: float
+
+
+def generate_author_communication(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    min_shared_files: int,
+) -> List[AuthorCommunication]:
+    """
+    Generates the weighted edges between authors who changed the same files,
+    by multiplying the sparse author x file matrix by its transpose.
+    Only the upper triangle of the product is read, and it is never made
+    dense, so memory grows with the number of edges rather than
+    the square of the number of authors.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param min_shared_files: The fewest files two authors must share
+    :return: List[AuthorCommunication] ordered by shared files, most first
+    """
+    table = as_git_file_commit_table(git_file_commits)
+
+    authorship = sparse.csr_matrix(
+        (
+            np.ones(len(table.committer_ids), dtype=np.int32),
+            (table.committer_ids, table.filepath_ids),
+        ),
+        shape=(len(table.committers), len(table.filepaths)),
+    )
+    # Many commits to one file still make one file
+    authorship.data[:] = 1
+    files_per_author = np.diff(authorship.indptr)
+
+    shared = sparse.triu(authorship @ authorship.T, k=1).tocoo()
+    kept = shared.data >= max(min_shared_files, 1)
+    authors, peers, shared_files = shared.row[kept], shared.col[kept], shared.data[kept]
+    strength = (
+        shared_files / ((files_per_author[authors] + files_per_author[peers]) / 2) * 100
+    )
+
+    order = np.lexsort((-strength, -shared_files))
+    return [
+        AuthorCommunication(
+            table.committers[author], table.committers[peer], *edge_weights
+        )
+        for author, peer, *edge_weights in zip(
+            authors[order].tolist(),
+            peers[order].tolist(),
+            shared_files[order].tolist(),
+            strength[order].tolist(),
+        )
+    ]
+
+
+def _committer_label(committer: Committer) -> str:
+    return f"{committer.name} <{committer.email}>"
+
+
+def report_author_communication_edges(
+    author_communication: List[AuthorCommunication],
+) -> pd.DataFrame:
+    """
+    Takes the edges of the developer communication graph and lays them out
+    as an edge list, one row per edge, with the authors as "name <email>",
+    ready to be written to csv and loaded into graph tools
+
+    :param author_communication: List[AuthorCommunication]
+    :return: pd.DataFrame with author, peer, shared_files and strength columns
+    """
+    return pd.DataFrame(
+        {
+            "author": [_committer_label(edge.author) for edge in author_communication],
+            "peer": [_committer_label(edge.peer) for edge in author_communication],
+            "shared_files": [edge.shared_files for edge in author_communication],
+            "strength": [edge.strength for edge in author_communication],
+        },
+        columns=["author", "peer", "shared_files", "strength"],
+    )
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from kedro_code_forensics.io.blob_cache import BlobCache
+from kedro_code_forensics.io.git_file_commit import (
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+from kedro_code_forensics.io.git_objects import BlobReader, resolve_blob_ids
+from kedro_code_forensics.io.indentation import (
+    IndentationComplexity,
+    indentation_complexity,
+)
+from kedro_code_forensics.nodes.transformations import HotSpotData
+
+# The number of complexities kept in the cache between runs
+COMPLEXITY_CACHE_SIZE = 1000000
+
+
+class ComplexityTrendPoint(NamedTuple):
+    """
+    The complexity of a file as of one revision.
+        hash: The hash of the commit that produced this revision
+        date: The commit date
+        lines: The number of lines in the file
+        total: The total indentation of the file
+        mean: The mean indentation of its non-blank lines
+        max: The deepest indentation
+        sd: The standard deviation of the indentation
+    """
+
+    hash: str
+    date: datetime
+    lines: int
+    total: float
+    mean: float
+    max: float
+    sd: float
+
+
+def _file_revisions(
+    table: GitFileCommitTable, filepaths: List[str]
+) -> List[Tuple[str, str, int]]:
+    revisions = []
+    for filepath, filepath_id in zip(
+        filepaths, pd.Index(table.filepaths).get_indexer(filepaths)
+    ):
+        if filepath_id < 0:
+            continue
+        (rows,) = np.nonzero(table.filepath_ids == filepath_id)
+        # Keep one row per commit, as the log can list a file twice in one
+        _, first_rows = np.unique(table.commit_ids[rows], return_index=True)
+        rows = rows[np.sort(first_rows)]
+        revisions.extend(
+            (filepath, table.hashes[commit_id], timestamp)
+            for commit_id, timestamp in zip(
+                table.commit_ids[rows].tolist(), table.timestamps[rows].tolist()
+            )
+        )
+    return revisions
+
+
+def _measure_blobs(
+    repository: str, blob_ids: Iterable[str], cache_path: Optional[str]
+) -> Dict[str, IndentationComplexity]:
+    cache: Union[BlobCache, Dict[str, IndentationComplexity]] = {}
+    if cache_path is not None:
+        cache = BlobCache(cache_path, "indentation", COMPLEXITY_CACHE_SIZE)
+
+    complexities = {blob_id: cache[blob_id] for blob_id in blob_ids if blob_id in cache}
+    unmeasured = [blob_id for blob_id in blob_ids if blob_id not in complexities]
+    if unmeasured:
+        # Measuring is vectorised and takes far less than
+        # handing each blob to another process would
+        with BlobReader(repository) as reader:
+            for blob_id, content in reader.iter_blobs(unmeasured):
+                complexities[blob_id] = cache[blob_id] = indentation_complexity(content)
+        if isinstance(cache, BlobCache):
+            cache.save()
+    return complexities
+
+
+def generate_complexity_trends(
+    hot_spots: List[HotSpotData],
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    repository: str,
+    top_n: int,
+    cache_path: Optional[str] = None,
+) -> Dict[str, List[ComplexityTrendPoint]]:
+    """
+    Generates the complexity trend of the top_n hot spots with the highest
+    rating, measuring the lines and indentation complexity of every
+    revision of each file found in the git log.
+    Revisions are resolved to blob ids with one git cat-file --batch-check
+    call, and each distinct blob is read once, through a single
+    git cat-file --batch process, and measured in this process.
+    The history of each file is selected from the columnar table,
+    without building a GitFileCommit per row.
+    With a cache_path, complexities are cached by blob id, so a later
+    run only reads and measures the revisions committed since.
+    Revisions in which a file does not exist at its current path,
+    such as its deletion or a commit before it was renamed, are skipped.
+
+    :param hot_spots: List[HotSpotData]
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param repository: The path to the git repository the log was read from
+    :param top_n: The number of hot spots to trend
+    :param cache_path: A file in which to keep complexities between runs
+    :return: Dict[filepath, List[ComplexityTrendPoint]] oldest first
+    """
+    top_hot_spots = sorted(hot_spots, key=lambda hot_spot: -hot_spot.rating)[:top_n]
+    filepaths = [hot_spot.filepath for hot_spot in top_hot_spots]
+
+    revisions = _file_revisions(as_git_file_commit_table(git_file_commits), filepaths)
+    blob_ids = resolve_blob_ids(
+        repository,
+        [f"{commit_hash}:{filepath}" for filepath, commit_hash, _ in revisions],
+    )
+    # Revisions that leave a file unchanged, such as reverts or
+    # mode changes, share a blob, which is only read and measured once
+    complexities = _measure_blobs(
+        repository,
+        list(dict.fromkeys(blob_id for blob_id in blob_ids if blob_id)),
+        cache_path,
+    )
+
+    trends: Dict[str, List[ComplexityTrendPoint]] = {
+        hot_spot.filepath: [] for hot_spot in top_hot_spots
+    }
+    # git log lists the newest commits first
+    for (filepath, commit_hash, timestamp), blob_id in reversed(
+        list(zip(revisions, blob_ids))
+    ):
+        if blob_id is not None:
+            date = datetime.fromtimestamp(timestamp, timezone.utc)
+            trends[filepath].append(
+                ComplexityTrendPoint(commit_hash, date, *complexities[blob_id])
+            )
+    return trends
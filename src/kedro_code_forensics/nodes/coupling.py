@@ -0,0 +1,160 @@
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from kedro_code_forensics.io.git_file_commit import (
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+
+
+class TemporalCoupling(NamedTuple):
+    """
+    The logical coupling of two files that change in the same commits.
+        filepath: The path to the first file
+        coupled_filepath: The path to the file it changes with
+        degree: The shared revisions as a percentage of
+            the average revisions of the two files
+        shared_revisions: The number of commits that change both files
+        average_revisions: The mean of the number of commits to each file
+    """
+
+    filepath: str
+    coupled_filepath: str
+    degree: float
+    shared_revisions: int
+    average_revisions: float
+
+
+class SumOfCoupling(NamedTuple):
+    """
+    The sum of coupling of a file: over every commit to the file,
+    the number of other files changed along with it.
+        filepath: The path to the file in question
+        coupling: The sum of coupling
+    """
+
+    filepath: str
+    coupling: int
+
+
+def _incidence_matrix(
+    table: GitFileCommitTable, max_changeset_size: int
+) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Builds the sparse commit x file matrix with a 1 wherever a commit
+    changes a file, leaving out commits that change more than
+    max_changeset_size files, as they say little about coupling.
+    Returns it along with the number of files each commit changes.
+    """
+    incidence = sparse.csr_matrix(
+        (
+            np.ones(len(table.commit_ids), dtype=np.int32),
+            (table.commit_ids, table.filepath_ids),
+        ),
+        shape=(len(table.hashes), len(table.filepaths)),
+    )
+    # A file listed twice in a commit is still one change
+    incidence.data[:] = 1
+
+    changeset_sizes = np.diff(incidence.indptr)
+    if max_changeset_size > 0:
+        kept = changeset_sizes <= max_changeset_size
+        incidence, changeset_sizes = incidence[kept], changeset_sizes[kept]
+    return incidence, changeset_sizes
+
+
+def generate_temporal_coupling(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    min_revisions: int,
+    min_shared_revisions: int,
+    min_coupling: float,
+    max_changeset_size: int,
+) -> List[TemporalCoupling]:
+    """
+    Generates the logical coupling between every pair of files that change
+    together. The co-change counts are the product of the sparse
+    commit x file incidence matrix with its transpose, so memory grows with
+    the number of coupled pairs rather than the square of the file count.
+    Capping max_changeset_size bounds the pairs any one commit adds.
+    Pairs are kept when both files have at least min_revisions, they share
+    at least min_shared_revisions and their degree is at least min_coupling.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param min_revisions: The fewest revisions of each file of a pair
+    :param min_shared_revisions: The fewest commits a pair must share
+    :param min_coupling: The lowest degree of coupling, in percent
+    :param max_changeset_size: The most files a commit may change to count,
+        or 0 to count every commit
+    :return: List[TemporalCoupling] ordered by degree, strongest first
+    """
+    table = as_git_file_commit_table(git_file_commits)
+    incidence, _ = _incidence_matrix(table, max_changeset_size)
+    revisions = np.asarray(incidence.sum(axis=0)).ravel()
+
+    # Files with too few revisions are dropped before the product
+    (eligible,) = np.nonzero(revisions >= max(min_revisions, 1))
+    incidence = incidence[:, eligible]
+    # Upper triangle only, as coupling is symmetric and a file
+    # is not coupled to itself
+    co_changes = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+    files, coupled_files = eligible[co_changes.row], eligible[co_changes.col]
+    shared = co_changes.data
+
+    average = (revisions[files] + revisions[coupled_files]) / 2
+    degree = shared / average * 100
+    kept = (shared >= min_shared_revisions) & (degree >= min_coupling)
+    files, coupled_files, shared, average, degree = (
+        files[kept],
+        coupled_files[kept],
+        shared[kept],
+        average[kept],
+        degree[kept],
+    )
+    order = np.lexsort((-shared, -degree))
+
+    return [
+        TemporalCoupling(
+            table.filepaths[file],
+            table.filepaths[coupled_file],
+            pair_degree,
+            pair_shared,
+            pair_average,
+        )
+        for file, coupled_file, pair_degree, pair_shared, pair_average in zip(
+            files[order].tolist(),
+            coupled_files[order].tolist(),
+            degree[order].tolist(),
+            shared[order].tolist(),
+            average[order].tolist(),
+        )
+    ]
+
+
+def generate_sum_of_coupling(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    max_changeset_size: int,
+) -> List[SumOfCoupling]:
+    """
+    Generates the sum of coupling of every file, a measure of how often it
+    changes along with other files, computed as the product of the
+    transposed incidence matrix with the size of each commit.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param max_changeset_size: The most files a commit may change to count,
+        or 0 to count every commit
+    :return: List[SumOfCoupling] ordered by coupling, highest first
+    """
+    table = as_git_file_commit_table(git_file_commits)
+    incidence, changeset_sizes = _incidence_matrix(table, max_changeset_size)
+    other_files = np.maximum(changeset_sizes - 1, 0)
+    coupling = incidence.T @ other_files
+
+    order = np.argsort(-coupling, kind="stable")
+    return [
+        SumOfCoupling(table.filepaths[file], file_coupling)
+        for file, file_coupling in zip(order.tolist(), coupling[order].tolist())
+        if file_coupling > 0
+    ]
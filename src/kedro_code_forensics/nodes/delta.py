@@ -0,0 +1,126 @@
+from typing import List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from kedro_code_forensics.io.cloc_file import ClocFile
+from kedro_code_forensics.nodes.transformations import GitRevisionAggregateTable
+
+
+class HotSpotDelta(NamedTuple):
+    """
+    How a file's hot spot changed from a base ref to a head ref.
+        filepath: The path to the file in question
+        lines: The number of lines of the file at the head ref
+        revisions: The commits to the file only at the head ref,
+            less those only at the base ref
+        churn: The lines churned, insertions plus deletions, only at
+            the head ref, less those churned only at the base ref
+        rating: The rating at the head ref less the rating at the base ref.
+            Positive when the head ref made the hot spot worse
+        base_rating: The lines multiplied by the revisions at the base ref
+        head_rating: The lines multiplied by the revisions at the head ref
+    """
+
+    filepath: str
+    lines: int
+    revisions: int
+    churn: int
+    rating: int
+    base_rating: int
+    head_rating: int
+
+
+def _scatter(index: pd.Index, filepaths: List[str], values: np.ndarray) -> np.ndarray:
+    scattered = np.zeros(len(index), dtype=np.int64)
+    scattered[index.get_indexer(filepaths)] = values
+    return scattered
+
+
+def generate_hot_spot_deltas(
+    base_git_revisions: GitRevisionAggregateTable,
+    base_only_git_revisions: GitRevisionAggregateTable,
+    head_only_git_revisions: GitRevisionAggregateTable,
+    base_cloc_files: List[ClocFile],
+    head_cloc_files: List[ClocFile],
+    top_k: int,
+) -> List[HotSpotDelta]:
+    """
+    Generates the change in revisions, churn and rating of every file
+    between a base ref and a head ref, such as main and a release branch.
+    Only the symmetric difference of the two refs is needed beyond the
+    base history: the commits only at the base ref (head..base) and only
+    at the head ref (base..head). The head's revisions are the base's,
+    less the first, plus the second, so the shared history is never
+    parsed a second time. Files that did not change are left out.
+
+    :param base_git_revisions: GitRevisionAggregateTable at the base ref
+    :param base_only_git_revisions: GitRevisionAggregateTable of head..base
+    :param head_only_git_revisions: GitRevisionAggregateTable of base..head
+    :param base_cloc_files: List[ClocFile] at the base ref
+    :param head_cloc_files: List[ClocFile] at the head ref
+    :param top_k: The number of deltas kept, or 0 to keep them all
+    :return: List[HotSpotDelta] ordered by rating delta, most worsened first
+    """
+    base_filepaths = [cloc_file.filepath for cloc_file in base_cloc_files]
+    head_filepaths = [cloc_file.filepath for cloc_file in head_cloc_files]
+    index = pd.Index(
+        [
+            *base_git_revisions.filepaths,
+            *base_only_git_revisions.filepaths,
+            *head_only_git_revisions.filepaths,
+            *base_filepaths,
+            *head_filepaths,
+        ]
+    ).unique()
+
+    base_revisions = _scatter(
+        index, base_git_revisions.filepaths, base_git_revisions.revisions
+    )
+    base_only_revisions = _scatter(
+        index, base_only_git_revisions.filepaths, base_only_git_revisions.revisions
+    )
+    head_only_revisions = _scatter(
+        index, head_only_git_revisions.filepaths, head_only_git_revisions.revisions
+    )
+    base_only_churn = _scatter(
+        index,
+        base_only_git_revisions.filepaths,
+        base_only_git_revisions.insertions + base_only_git_revisions.deletions,
+    )
+    head_only_churn = _scatter(
+        index,
+        head_only_git_revisions.filepaths,
+        head_only_git_revisions.insertions + head_only_git_revisions.deletions,
+    )
+    base_lines = _scatter(
+        index, base_filepaths, [cloc_file.code for cloc_file in base_cloc_files]
+    )
+    head_lines = _scatter(
+        index, head_filepaths, [cloc_file.code for cloc_file in head_cloc_files]
+    )
+
+    head_revisions = base_revisions - base_only_revisions + head_only_revisions
+    base_ratings = base_lines * base_revisions
+    head_ratings = head_lines * head_revisions
+    revisions = head_only_revisions - base_only_revisions
+    churn = head_only_churn - base_only_churn
+    ratings = head_ratings - base_ratings
+
+    (changed,) = np.nonzero((revisions != 0) | (churn != 0) | (ratings != 0))
+    order = changed[np.lexsort((-revisions[changed], -ratings[changed]))]
+    if top_k > 0:
+        order = order[:top_k]
+
+    return [
+        HotSpotDelta(index[file], *delta)
+        for file, *delta in zip(
+            order.tolist(),
+            head_lines[order].tolist(),
+            revisions[order].tolist(),
+            churn[order].tolist(),
+            ratings[order].tolist(),
+            base_ratings[order].tolist(),
+            head_ratings[order].tolist(),
+        )
+    ]
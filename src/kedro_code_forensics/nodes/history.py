@@ -0,0 +1,109 @@
+from datetime import date
+from typing import Iterable, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+from kedro_code_forensics.io.cloc_file import ClocFile
+from kedro_code_forensics.io.git_file_commit import (
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+from kedro_code_forensics.nodes.periods import period_indexes, period_starts
+from kedro_code_forensics.nodes.transformations import HotSpotData, rank_hot_spots
+
+
+class HotSpotWindow(NamedTuple):
+    """
+    The hot spots of a window of time, rated by the revisions in the window.
+        start: The first day of the window
+        end: The first day after the window
+        hot_spots: The hot spots of the files changed in the window
+    """
+
+    start: date
+    end: date
+    hot_spots: List[HotSpotData]
+
+
+def generate_hot_spot_history(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+    cloc_files: List[ClocFile],
+    period: str,
+    window: int,
+    step: int,
+    top_k: int,
+    min_rating: int,
+) -> List[HotSpotWindow]:
+    """
+    Generates the hot spots of every window of window periods, one window
+    starting every step periods from the first commit, from a single log.
+    Every row is coded as one integer, its file then its period, and the
+    codes are sorted once with their cumulative revision counts.
+    The revisions of a file in any window [a, b) are then the difference
+    of two prefix sums, found by binary search, so no window reads the log.
+    A window of 3 months stepping 3 months gives the hot spots per quarter.
+    Sizes are those of cloc_files, and files not changed in a window
+    are left out of it.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :param cloc_files: List[ClocFile]
+    :param period: "week" or "month"
+    :param window: The number of periods in each window
+    :param step: The number of periods between the starts of two windows
+    :param top_k: The number of hot spots kept per window, or 0 for all
+    :param min_rating: The lowest rating kept, or 0 to keep them all
+    :return: List[HotSpotWindow] ordered by start
+    """
+    table = as_git_file_commit_table(git_file_commits)
+
+    if window < 1 or step < 1:
+        raise ValueError(f"window and step must be positive, got {window}, {step}")
+    if len(table.timestamps) == 0:
+        return []
+
+    indexes = period_indexes(table.timestamps, period)
+    first_period = indexes.min()
+    periods = indexes - first_period
+    starts = np.arange(0, periods.max() + 1, step)
+    ends = starts + window
+    # Wide enough that the end of a file's last window
+    # stays below the first code of the next file
+    span = int(ends.max()) + 1
+
+    codes, revisions = np.unique(
+        table.filepath_ids.astype(np.int64) * span + periods, return_counts=True
+    )
+    cumulative_revisions = np.concatenate(([0], np.cumsum(revisions)))
+
+    filepaths = [cloc_file.filepath for cloc_file in cloc_files]
+    rows = pd.Index(table.filepaths).get_indexer(filepaths)
+    (joined,) = np.nonzero(rows >= 0)
+    sizes = np.array([cloc_file.code for cloc_file in cloc_files], dtype=np.int64)
+    sizes = sizes[joined]
+    file_codes = rows[joined].astype(np.int64) * span
+
+    history = []
+    for start, end, start_date, end_date in zip(
+        starts,
+        ends,
+        period_starts(starts + first_period, period),
+        period_starts(ends + first_period, period),
+    ):
+        window_revisions = (
+            cumulative_revisions[np.searchsorted(codes, file_codes + end)]
+            - cumulative_revisions[np.searchsorted(codes, file_codes + start)]
+        )
+        changed = window_revisions > 0
+        hot_spots = rank_hot_spots(
+            filepaths,
+            joined[changed],
+            sizes[changed],
+            window_revisions[changed],
+            None,
+            top_k,
+            min_rating,
+        )
+        history.append(HotSpotWindow(start_date, end_date, hot_spots))
+    return history
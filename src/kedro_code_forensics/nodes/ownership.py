@@ -0,0 +1,95 @@
+from typing import Iterable, List, NamedTuple, Union
+
+import numpy as np
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+    as_git_file_commit_table,
+)
+
+
+class FileOwnership(NamedTuple):
+    """
+    Who knows a file, judged by the lines each author added to it.
+        filepath: The path to the file in question
+        main_developer: The author who added the most lines to the file
+        ownership: The share of the added lines the main developer added,
+            0 when no lines were added
+        authors: The number of distinct authors of the file
+        fragmentation: The entropy, in bits, of the added lines by author.
+            0 when one author added every line, growing as they are
+            spread evenly over more authors
+    """
+
+    filepath: str
+    main_developer: Committer
+    ownership: float
+    authors: int
+    fragmentation: float
+
+
+def generate_file_ownership(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+) -> List[FileOwnership]:
+    """
+    Generates the main developer, number of authors and ownership
+    fragmentation of every file in the git log.
+    Every (file, author) pair is coded as one integer, so the lines and
+    revisions of each pair come from a single np.unique and np.bincount,
+    and each file's pairs end up next to each other for the per-file sums.
+    When no lines were added to a file, its main developer
+    is the author with the most revisions.
+
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :return: List[FileOwnership] in the order files first appear in the log
+    """
+    table = as_git_file_commit_table(git_file_commits)
+
+    if len(table.filepath_ids) == 0:
+        return []
+
+    author_count = len(table.committers)
+    pair_keys = table.filepath_ids.astype(np.int64) * author_count + (
+        table.committer_ids
+    )
+    pairs, pair_ids = np.unique(pair_keys, return_inverse=True)
+    pair_files, pair_authors = np.divmod(pairs, author_count)
+    pair_added = np.bincount(pair_ids, weights=table.insertions)
+    pair_revisions = np.bincount(pair_ids)
+
+    file_count = len(table.filepaths)
+    file_added = np.bincount(pair_files, weights=pair_added, minlength=file_count)
+    authors = np.bincount(pair_files, minlength=file_count)
+
+    shares = np.divide(
+        pair_added,
+        file_added[pair_files],
+        out=np.zeros_like(pair_added),
+        where=file_added[pair_files] > 0,
+    )
+    entropy_terms = np.zeros_like(shares)
+    owned = shares > 0
+    entropy_terms[owned] = -shares[owned] * np.log2(shares[owned])
+    fragmentation = np.bincount(pair_files, weights=entropy_terms, minlength=file_count)
+
+    # Within each file, the pair with the most added lines, then revisions,
+    # comes first, so the first pair of each file is its main developer
+    order = np.lexsort((-pair_revisions, -pair_added, pair_files))
+    first_pairs = order[np.r_[0, np.flatnonzero(np.diff(pair_files[order])) + 1]]
+    main_developers = np.empty(file_count, dtype=np.int64)
+    main_developers[pair_files[first_pairs]] = pair_authors[first_pairs]
+    ownership = np.zeros(file_count)
+    ownership[pair_files[first_pairs]] = shares[first_pairs]
+
+    return [
+        FileOwnership(filepath, table.committers[author], *file_ownership)
+        for filepath, author, *file_ownership in zip(
+            table.filepaths,
+            main_developers.tolist(),
+            ownership.tolist(),
+            authors.tolist(),
+            fragmentation.tolist(),
+        )
+    ]
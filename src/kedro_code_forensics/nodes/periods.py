@@ -0,0 +1,41 @@
+from datetime import date
+from typing import List
+
+import numpy as np
+
+PERIODS = ("week", "month")
+
+
+def period_indexes(timestamps: np.ndarray, period: str) -> np.ndarray:
+    """
+    Numbers the week or month of each timestamp, counting from the epoch.
+    Weeks start on Mondays.
+
+    :param timestamps: Seconds since the epoch
+    :param period: "week" or "month"
+    :return: The index of the period of each timestamp
+    """
+    if period == "month":
+        return (
+            timestamps.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64)
+        )
+    if period == "week":
+        days = (
+            timestamps.astype("datetime64[s]").astype("datetime64[D]").astype(np.int64)
+        )
+        # The epoch fell on a Thursday, so weeks are shifted to start on Mondays
+        return (days + 3) // 7
+    raise ValueError(f"Unknown period {period!r}, expected one of {PERIODS}")
+
+
+def period_starts(period_indexes: np.ndarray, period: str) -> List[date]:
+    """
+    Returns the first day of each of the numbered weeks or months.
+
+    :param period_indexes: Period numbers, as period_indexes returns them
+    :param period: "week" or "month"
+    :return: List[date] of the first day of each period
+    """
+    if period == "month":
+        return period_indexes.astype("datetime64[M]").astype("datetime64[D]").tolist()
+    return (period_indexes * 7 - 3).astype("datetime64[D]").tolist()
@@ -2,6 +2,8 @@ import os
 from typing import List
 
 from kedro_code_forensics.io.bubble_packer import BubblePack
+from kedro_code_forensics.nodes.age import CodeAge
+from kedro_code_forensics.nodes.delta import HotSpotDelta
 from kedro_code_forensics.nodes.transformations import HotSpotData
 
 
@@ -36,3 +38,53 @@ def report_hot_spots_bubble_pack(hot_spots: List[HotSpotData]) -> List[BubblePac
         )
 
     return out_bubble_packs
+
+
+def report_code_age_bubble_pack(
+    hot_spots: List[HotSpotData], code_ages: List[CodeAge]
+) -> List[BubblePack]:
+    """
+    Takes a list of HotSpotData and the age of each file and
+    transforms them into BubblePack tuples, sized as the hot spots are
+    but colored by the age of each file in months
+
+    :param hot_spots: List[HostSpotData]
+    :param code_ages: List[CodeAge]
+    :return: List[BubblePack]
+    """
+    age_months = {code_age.filepath: code_age.age_months for code_age in code_ages}
+
+    return [
+        BubblePack(
+            path=_extract_path(hot_spot.filepath),
+            size=hot_spot.lines,
+            value=hot_spot.rating,
+            color=age_months[hot_spot.filepath],
+        )
+        for hot_spot in hot_spots
+        if hot_spot.filepath in age_months
+    ]
+
+
+def report_hot_spot_delta_bubble_pack(
+    hot_spot_deltas: List[HotSpotDelta],
+) -> List[BubblePack]:
+    """
+    Takes a list of HotSpotDelta and transforms them into BubblePack tuples,
+    sized by how much each rating changed and colored by the change itself,
+    for a BubblePackerDataSet saved with a diverging color scale.
+    Files whose rating did not change are left out
+
+    :param hot_spot_deltas: List[HotSpotDelta]
+    :return: List[BubblePack]
+    """
+    return [
+        BubblePack(
+            path=_extract_path(hot_spot_delta.filepath),
+            size=hot_spot_delta.lines,
+            value=abs(hot_spot_delta.rating),
+            color=hot_spot_delta.rating,
+        )
+        for hot_spot_delta in hot_spot_deltas
+        if hot_spot_delta.rating != 0
+    ]
@@ -1,9 +1,13 @@
-from typing import Dict, List, NamedTuple
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from kedro_code_forensics.io.cloc_file import ClocFile
-from kedro_code_forensics.io.git_file_commit import GitFileCommit
+from kedro_code_forensics.io.cyclomatic import CyclomaticComplexity
+from kedro_code_forensics.io.git_file_commit import GitFileCommit, GitFileCommitTable
+from kedro_code_forensics.io.indentation import IndentationComplexity
 
 
 class GitRevisionAggregate(NamedTuple):
@@ -21,34 +25,132 @@ class GitRevisionAggregate(NamedTuple):
     deletions: int
 
 
+class GitRevisionAggregateTable(NamedTuple):
+    """
+    GitRevisionAggregateTable is a columnar alternative to a dictionary of
+    GitRevisionAggregates. Row i holds the aggregate of filepaths[i].
+        filepaths: The distinct filepaths
+        revisions: The count of the number of commits to each file
+        insertions: The sum of the insertions for each file over all commits
+        deletions: The sum of the deletions for each file over all commits
+    """
+
+    filepaths: List[str]
+    revisions: np.ndarray
+    insertions: np.ndarray
+    deletions: np.ndarray
+
+    def to_dict(self) -> Dict[str, GitRevisionAggregate]:
+        """
+        Returns the aggregates as a dictionary keyed by filepath.
+        """
+        return {
+            filepath: GitRevisionAggregate(filepath, revisions, insertions, deletions)
+            for filepath, revisions, insertions, deletions in zip(
+                self.filepaths,
+                self.revisions.tolist(),
+                self.insertions.tolist(),
+                self.deletions.tolist(),
+            )
+        }
+
+
+# The number of GitFileCommits integer coded at a time,
+# so streamed git logs are aggregated in bounded memory
+AGGREGATION_BATCH_SIZE = 100000
+
+
+def _batched(items: Iterable, batch_size: int) -> Iterator[List]:
+    iterator = iter(items)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+def _sum_by_id(
+    ids: np.ndarray, weights: Optional[np.ndarray], count: int
+) -> np.ndarray:
+    return np.bincount(ids, weights=weights, minlength=count).astype(np.int64)
+
+
+def _aggregate_git_file_commit_table(
+    table: GitFileCommitTable,
+) -> GitRevisionAggregateTable:
+    file_count = len(table.filepaths)
+    return GitRevisionAggregateTable(
+        filepaths=list(table.filepaths),
+        revisions=_sum_by_id(table.filepath_ids, None, file_count),
+        insertions=_sum_by_id(table.filepath_ids, table.insertions, file_count),
+        deletions=_sum_by_id(table.filepath_ids, table.deletions, file_count),
+    )
+
+
+def _aggregate_git_file_commits(
+    git_file_commits: Iterable[GitFileCommit],
+) -> GitRevisionAggregateTable:
+    filepath_index: Dict[str, int] = {}
+    totals = np.zeros((3, 0), dtype=np.int64)
+
+    for batch in _batched(git_file_commits, AGGREGATION_BATCH_SIZE):
+        filepath_ids = np.fromiter(
+            (
+                filepath_index.setdefault(file_commit.filepath, len(filepath_index))
+                for file_commit in batch
+            ),
+            dtype=np.intp,
+            count=len(batch),
+        )
+        changes = np.array(
+            [(file_commit.insertions, file_commit.deletions) for file_commit in batch],
+            dtype=np.int64,
+        )
+        file_count = len(filepath_index)
+        totals = np.pad(totals, ((0, 0), (0, file_count - totals.shape[1])))
+        totals += [
+            _sum_by_id(filepath_ids, None, file_count),
+            _sum_by_id(filepath_ids, changes[:, 0], file_count),
+            _sum_by_id(filepath_ids, changes[:, 1], file_count),
+        ]
+
+    revisions, insertions, deletions = totals
+    return GitRevisionAggregateTable(
+        list(filepath_index), revisions, insertions, deletions
+    )
+
+
+def generate_git_revision_aggregate_table(
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
+) -> GitRevisionAggregateTable:
+    """
+    Aggregates per-file commit data into a GitRevisionAggregateTable,
+    summing the insertions, deletions, and count of number of commits
+    (revisions) of each file with np.bincount over integer coded filepaths.
+    The commits may be a list or a stream of GitFileCommits,
+    which are consumed in batches of AGGREGATION_BATCH_SIZE,
+    or a GitFileCommitTable, which is counted directly on its columns
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
+    :return: GitRevisionAggregateTable
+    """
+    if isinstance(git_file_commits, GitFileCommitTable):
+        return _aggregate_git_file_commit_table(git_file_commits)
+    return _aggregate_git_file_commits(git_file_commits)
+
+
 def generate_git_revision_aggregates(
-    git_file_commits: List[GitFileCommit],
+    git_file_commits: Union[Iterable[GitFileCommit], GitFileCommitTable],
 ) -> Dict[str, GitRevisionAggregate]:
     """
     Aggregates per-file commit data, returning the sum of
     all insertions, deletions, and count of number of commits
     (revisions) that this particular file has gone through,
     returning the data in the form of a dictionary with
-    the filepath as key and the GitRevisionAggregate as a value
-    :param git_file_commits: List[GitFileCommit]
+    the filepath as key and the GitRevisionAggregate as a value.
+    This is the dictionary view of generate_git_revision_aggregate_table
+    :param git_file_commits: Iterable[GitFileCommit] or GitFileCommitTable
     :return: Dict[filepath, GitRevisionAggregate]
     """
-    df = pd.DataFrame(git_file_commits)
-    df["revisions"] = 1
-    raw_revisions = (
-        df[["filepath", "revisions", "insertions", "deletions"]]
-        .groupby("filepath")
-        .sum()
-    )
-    revisions = {}
-    for filepath, raw_revision in raw_revisions.iterrows():
-        revisions[filepath] = GitRevisionAggregate(
-            filepath,
-            raw_revision["revisions"],
-            raw_revision["insertions"],
-            raw_revision["deletions"],
-        )
-    return revisions
+    return generate_git_revision_aggregate_table(git_file_commits).to_dict()
 
 
 class HotSpotData(NamedTuple):
@@ -56,8 +158,10 @@ class HotSpotData(NamedTuple):
     A tuple containing the calculations used to identify hotspots.
         filepath: THe filepath in question for the hotpsot analysis
         revisions: The number of revisions to a file
-        lines: The number of lines for a file that acts as a proxy for complexity
+        lines: The number of lines for a file that acts as a proxy for complexity,
+            or its cyclomatic complexity for generate_cyclomatic_hot_spots
         rating: The lines multiplied by the complexity
+        indentation: The indentation complexity of the file, when measured
     """
 
     filepath: str
@@ -66,33 +170,209 @@ class HotSpotData(NamedTuple):
     # The less revisions and the less complex, the better
     # The higher this number is, the worst it gets
     rating: int
+    indentation: Optional[IndentationComplexity] = None
 
 
 def generate_hot_spots(
-    git_revisions: Dict[str, GitRevisionAggregate], cloc_files: List[ClocFile]
+    git_revisions: Union[Dict[str, GitRevisionAggregate], GitRevisionAggregateTable],
+    cloc_files: List[ClocFile],
+    top_k: int = 0,
+    min_rating: int = 0,
 ) -> List[HotSpotData]:
     """
     Generates hotspot data by taking the revision aggregates and cloc_files,
-    aggregating on the filepath, and applying simple calculations on to them to
-    generate a simple rating for a hotspot
+    joining them on the filepath, and applying simple calculations on to them to
+    generate a simple rating for a hotspot.
+    The join and the ratings are computed on arrays, and HotSpotData is only
+    built for the files that are kept: those rated at least min_rating,
+    and of those the top_k with the highest rating, worst first.
+    With a top_k and a min_rating of 0 every file is kept,
+    in the order of cloc_files
 
-    :param git_revisions: Dict[str, GitRevisionAggregate] keyed by filepath
+    :param git_revisions: Dict[str, GitRevisionAggregate] keyed by filepath,
+        or GitRevisionAggregateTable
     :param cloc_files: List[ClocFile]
+    :param top_k: The number of hot spots kept, or 0 to keep them all
+    :param min_rating: The lowest rating kept, or 0 to keep them all
     :return: List[HotSpotData[
     """
-    hot_spot_data: List[HotSpotData] = []
-
-    for cloc_file in cloc_files:
-        git_revision = git_revisions.get(cloc_file.filepath)
-        if git_revision is None:
-            continue
-        hot_spot_data.append(
-            HotSpotData(
-                cloc_file.filepath,
-                git_revision.revisions,
-                cloc_file.code,
-                rating=cloc_file.code * git_revision.revisions,
-            )
+    return _generate_hot_spots(
+        git_revisions,
+        [cloc_file.filepath for cloc_file in cloc_files],
+        [cloc_file.code for cloc_file in cloc_files],
+        None,
+        top_k,
+        min_rating,
+    )
+
+
+def generate_indentation_hot_spots(
+    git_revisions: Union[Dict[str, GitRevisionAggregate], GitRevisionAggregateTable],
+    cloc_files: List[ClocFile],
+    indentation: Dict[str, IndentationComplexity],
+    top_k: int = 0,
+    min_rating: int = 0,
+) -> List[HotSpotData]:
+    """
+    Generates hotspot data as generate_hot_spots does, and attaches the
+    indentation complexity of each file, when it was measured
+
+    :param git_revisions: Dict[str, GitRevisionAggregate] keyed by filepath,
+        or GitRevisionAggregateTable
+    :param cloc_files: List[ClocFile]
+    :param indentation: Dict[str, IndentationComplexity] keyed by filepath
+    :param top_k: The number of hot spots kept, or 0 to keep them all
+    :param min_rating: The lowest rating kept, or 0 to keep them all
+    :return: List[HotSpotData]
+    """
+    return _generate_hot_spots(
+        git_revisions,
+        [cloc_file.filepath for cloc_file in cloc_files],
+        [cloc_file.code for cloc_file in cloc_files],
+        indentation,
+        top_k,
+        min_rating,
+    )
+
+
+def generate_cyclomatic_hot_spots(
+    git_revisions: Union[Dict[str, GitRevisionAggregate], GitRevisionAggregateTable],
+    cyclomatic_complexities: Dict[str, CyclomaticComplexity],
+    top_k: int = 0,
+    min_rating: int = 0,
+) -> List[HotSpotData]:
+    """
+    Generates hotspot data as generate_hot_spots does, using the
+    cyclomatic complexity of each Python file in place of its line count,
+    both as the lines of the hot spot and in its rating
+
+    :param git_revisions: Dict[str, GitRevisionAggregate] keyed by filepath,
+        or GitRevisionAggregateTable
+    :param cyclomatic_complexities: Dict[str, CyclomaticComplexity]
+    :param top_k: The number of hot spots kept, or 0 to keep them all
+    :param min_rating: The lowest rating kept, or 0 to keep them all
+    :return: List[HotSpotData]
+    """
+    return _generate_hot_spots(
+        git_revisions,
+        list(cyclomatic_complexities),
+        [
+            cyclomatic_complexity.complexity
+            for cyclomatic_complexity in cyclomatic_complexities.values()
+        ],
+        None,
+        top_k,
+        min_rating,
+    )
+
+
+def _as_revision_table(
+    git_revisions: Union[Dict[str, GitRevisionAggregate], GitRevisionAggregateTable],
+) -> GitRevisionAggregateTable:
+    if isinstance(git_revisions, GitRevisionAggregateTable):
+        return git_revisions
+    return GitRevisionAggregateTable(
+        filepaths=list(git_revisions),
+        revisions=np.array(
+            [git_revision.revisions for git_revision in git_revisions.values()],
+            dtype=np.int64,
+        ),
+        insertions=np.array(
+            [git_revision.insertions for git_revision in git_revisions.values()],
+            dtype=np.int64,
+        ),
+        deletions=np.array(
+            [git_revision.deletions for git_revision in git_revisions.values()],
+            dtype=np.int64,
+        ),
+    )
+
+
+def _generate_hot_spots(
+    git_revisions: Union[Dict[str, GitRevisionAggregate], GitRevisionAggregateTable],
+    filepaths: List[str],
+    sizes: List[int],
+    indentation: Optional[Dict[str, IndentationComplexity]],
+    top_k: int,
+    min_rating: int,
+) -> List[HotSpotData]:
+    revision_table = _as_revision_table(git_revisions)
+
+    # The row of each file in the revision table, or -1 if it has none
+    rows = pd.Index(revision_table.filepaths).get_indexer(filepaths)
+    (joined,) = np.nonzero(rows >= 0)
+    return rank_hot_spots(
+        filepaths,
+        joined,
+        np.asarray(sizes, dtype=np.int64)[joined],
+        revision_table.revisions[rows[joined]],
+        indentation,
+        top_k,
+        min_rating,
+    )
+
+
+def rank_hot_spots(
+    filepaths: List[str],
+    joined: np.ndarray,
+    sizes: np.ndarray,
+    revisions: np.ndarray,
+    indentation: Optional[Dict[str, IndentationComplexity]],
+    top_k: int,
+    min_rating: int,
+) -> List[HotSpotData]:
+    """
+    Rates the joined files, the indexes into filepaths of the given sizes and
+    revisions, and builds HotSpotData for those kept by min_rating and top_k.
+    When either is set, hot spots come worst first, by rating and then by
+    revisions. When neither is set, they keep the order of joined.
+
+    :param filepaths: The filepaths joined indexes into
+    :param joined: The index into filepaths of each rated file
+    :param sizes: The lines of each rated file
+    :param revisions: The revisions of each rated file
+    :param indentation: Dict[str, IndentationComplexity] keyed by filepath
+    :param top_k: The number of hot spots kept, or 0 to keep them all
+    :param min_rating: The lowest rating kept, or 0 to keep them all
+    :return: List[HotSpotData]
+    """
+    indentation = indentation or {}
+    ratings = sizes * revisions
+
+    if min_rating > 0:
+        kept = ratings >= min_rating
+        joined, sizes, revisions, ratings = (
+            joined[kept],
+            sizes[kept],
+            revisions[kept],
+            ratings[kept],
         )
 
-    return hot_spot_data
+    if top_k > 0 or min_rating > 0:
+        candidates = np.arange(len(ratings))
+        if 0 < top_k < len(ratings):
+            # Every file rated as high as the top_k-th is a candidate,
+            # so ties on the rating are broken by revisions below
+            kth = len(ratings) - top_k
+            (candidates,) = np.nonzero(ratings >= np.partition(ratings, kth)[kth])
+        order = candidates[np.lexsort((-revisions[candidates], -ratings[candidates]))]
+        if top_k > 0:
+            order = order[:top_k]
+    else:
+        order = np.arange(len(ratings))
+
+    return [
+        HotSpotData(
+            filepaths[file_index],
+            revision_count,
+            size,
+            rating=rating,
+            indentation=indentation.get(filepaths[file_index]),
+        )
+        for file_index, revision_count, size, rating in zip(
+            joined[order].tolist(),
+            revisions[order].tolist(),
+            sizes[order].tolist(),
+            ratings[order].tolist(),
+        )
+    ]
@@ -33,10 +33,36 @@ from typing import Dict
 
 from kedro.pipeline import Pipeline, node
 
-from kedro_code_forensics.nodes.reporters import report_hot_spots_bubble_pack
+from kedro_code_forensics.nodes.age import (
+    generate_code_age,
+    generate_directory_code_age,
+)
+from kedro_code_forensics.nodes.churn import (
+    generate_directory_churn,
+    generate_file_churn,
+)
+from kedro_code_forensics.nodes.communication import (
+    generate_author_communication,
+    report_author_communication_edges,
+)
+from kedro_code_forensics.nodes.complexity import generate_complexity_trends
+from kedro_code_forensics.nodes.coupling import (
+    generate_sum_of_coupling,
+    generate_temporal_coupling,
+)
+from kedro_code_forensics.nodes.delta import generate_hot_spot_deltas
+from kedro_code_forensics.nodes.history import generate_hot_spot_history
+from kedro_code_forensics.nodes.ownership import generate_file_ownership
+from kedro_code_forensics.nodes.reporters import (
+    report_code_age_bubble_pack,
+    report_hot_spot_delta_bubble_pack,
+    report_hot_spots_bubble_pack,
+)
 from kedro_code_forensics.nodes.transformations import (
-    generate_git_revision_aggregates,
+    generate_cyclomatic_hot_spots,
+    generate_git_revision_aggregate_table,
     generate_hot_spots,
+    generate_indentation_hot_spots,
 )
 
 
@@ -55,13 +81,43 @@ def create_pipelines(**kwargs) -> Dict[str, Pipeline]:
         "__default__": Pipeline(
             [
                 node(
-                    generate_git_revision_aggregates,
+                    generate_git_revision_aggregate_table,
                     inputs="git_files",
                     outputs="git_revisions",
                 ),
                 node(
                     generate_hot_spots,
-                    inputs=["git_revisions", "cloc_files"],
+                    inputs=[
+                        "git_revisions",
+                        "cloc_files",
+                        "params:hot_spot_top_k",
+                        "params:hot_spot_min_rating",
+                    ],
+                    outputs="hot_spots",
+                ),
+                node(
+                    report_hot_spots_bubble_pack,
+                    inputs="hot_spots",
+                    outputs="hot_spot_bubble_packer",
+                ),
+            ]
+        ),
+        "indentation_hot_spots": Pipeline(
+            [
+                node(
+                    generate_git_revision_aggregate_table,
+                    inputs="git_files",
+                    outputs="git_revisions",
+                ),
+                node(
+                    generate_indentation_hot_spots,
+                    inputs=[
+                        "git_revisions",
+                        "cloc_files",
+                        "indentation_files",
+                        "params:hot_spot_top_k",
+                        "params:hot_spot_min_rating",
+                    ],
                     outputs="hot_spots",
                 ),
                 node(
@@ -70,5 +126,169 @@ def create_pipelines(**kwargs) -> Dict[str, Pipeline]:
                     outputs="hot_spot_bubble_packer",
                 ),
             ]
-        )
+        ),
+        "cyclomatic_hot_spots": Pipeline(
+            [
+                node(
+                    generate_git_revision_aggregate_table,
+                    inputs="git_files",
+                    outputs="git_revisions",
+                ),
+                node(
+                    generate_cyclomatic_hot_spots,
+                    inputs=[
+                        "git_revisions",
+                        "cyclomatic_files",
+                        "params:hot_spot_top_k",
+                        "params:hot_spot_min_rating",
+                    ],
+                    outputs="cyclomatic_hot_spots",
+                ),
+                node(
+                    report_hot_spots_bubble_pack,
+                    inputs="cyclomatic_hot_spots",
+                    outputs="cyclomatic_hot_spot_bubble_packer",
+                ),
+            ]
+        ),
+        "temporal_coupling": Pipeline(
+            [
+                node(
+                    generate_temporal_coupling,
+                    inputs=[
+                        "git_files",
+                        "params:coupling_min_revisions",
+                        "params:coupling_min_shared_revisions",
+                        "params:coupling_min_degree",
+                        "params:coupling_max_changeset_size",
+                    ],
+                    outputs="temporal_coupling",
+                ),
+                node(
+                    generate_sum_of_coupling,
+                    inputs=["git_files", "params:coupling_max_changeset_size"],
+                    outputs="sum_of_coupling",
+                ),
+            ]
+        ),
+        "code_age": Pipeline(
+            [
+                node(generate_code_age, inputs="git_files", outputs="code_age"),
+                node(
+                    generate_directory_code_age,
+                    inputs="code_age",
+                    outputs="directory_code_age",
+                ),
+                node(
+                    report_code_age_bubble_pack,
+                    inputs=["hot_spots", "code_age"],
+                    outputs="code_age_bubble_packer",
+                ),
+            ]
+        ),
+        "ownership": Pipeline(
+            [
+                node(
+                    generate_file_ownership,
+                    inputs="git_files",
+                    outputs="file_ownership",
+                )
+            ]
+        ),
+        "communication": Pipeline(
+            [
+                node(
+                    generate_author_communication,
+                    inputs=["git_files", "params:communication_min_shared_files"],
+                    outputs="author_communication",
+                ),
+                node(
+                    report_author_communication_edges,
+                    inputs="author_communication",
+                    outputs="author_communication_edges",
+                ),
+            ]
+        ),
+        "churn": Pipeline(
+            [
+                node(
+                    generate_file_churn,
+                    inputs=["git_files", "params:churn_period", "params:churn_window"],
+                    outputs="file_churn",
+                ),
+                node(
+                    generate_directory_churn,
+                    inputs=["git_files", "params:churn_period", "params:churn_window"],
+                    outputs="directory_churn",
+                ),
+            ]
+        ),
+        "hot_spot_history": Pipeline(
+            [
+                node(
+                    generate_hot_spot_history,
+                    inputs=[
+                        "git_files",
+                        "cloc_files",
+                        "params:hot_spot_history_period",
+                        "params:hot_spot_history_window",
+                        "params:hot_spot_history_step",
+                        "params:hot_spot_top_k",
+                        "params:hot_spot_min_rating",
+                    ],
+                    outputs="hot_spot_history",
+                )
+            ]
+        ),
+        "hot_spot_delta": Pipeline(
+            [
+                node(
+                    generate_git_revision_aggregate_table,
+                    inputs="delta_base_git_files",
+                    outputs="delta_base_git_revisions",
+                ),
+                node(
+                    generate_git_revision_aggregate_table,
+                    inputs="delta_base_only_git_files",
+                    outputs="delta_base_only_git_revisions",
+                ),
+                node(
+                    generate_git_revision_aggregate_table,
+                    inputs="delta_head_only_git_files",
+                    outputs="delta_head_only_git_revisions",
+                ),
+                node(
+                    generate_hot_spot_deltas,
+                    inputs=[
+                        "delta_base_git_revisions",
+                        "delta_base_only_git_revisions",
+                        "delta_head_only_git_revisions",
+                        "delta_base_cloc_files",
+                        "delta_head_cloc_files",
+                        "params:hot_spot_top_k",
+                    ],
+                    outputs="hot_spot_deltas",
+                ),
+                node(
+                    report_hot_spot_delta_bubble_pack,
+                    inputs="hot_spot_deltas",
+                    outputs="hot_spot_delta_bubble_packer",
+                ),
+            ]
+        ),
+        "complexity_trends": Pipeline(
+            [
+                node(
+                    generate_complexity_trends,
+                    inputs=[
+                        "hot_spots",
+                        "git_files",
+                        "params:repository_path",
+                        "params:complexity_trend_top_n",
+                        "params:complexity_trend_cache_path",
+                    ],
+                    outputs="complexity_trends",
+                )
+            ]
+        ),
     }
@@ -60,6 +60,8 @@ class ProjectContext(KedroContext):
             "path": os.path.expanduser(extra_params.get("path", os.getcwd())),
             "before": extra_params.get("before", None),
             "after": extra_params.get("after", None),
+            "base": extra_params.get("base", None),
+            "head": extra_params.get("head", None),
         }
         return TemplatedConfigLoader(
             config_loader.conf_paths, globals_dict=git_path_config,
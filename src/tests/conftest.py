@@ -1,3 +1,5 @@
+import os
+import subprocess
 from datetime import datetime
 
 import pytest
@@ -22,6 +24,22 @@ commit:79c6a2a0e4a8f57fd81dd8f50531ec9a9f24bedb,2020-03-01T19:14:58+08:00,"Tam N
     return raw_output
 
 
+@pytest.fixture
+def separated_raw_git_log():
+    raw_output = """\
+\x0046dae90e5219c14e12f805ac5e34eea037b24dca\x002020-03-01T18:14:49+08:00\x00Tam Nguyen\x00Tam_Nguyen@McKinsey.com\x00Testing
+1\t3\tsrc/kedro_code_forensics/io/git_file_commit.py
+6\t4\tsrc/kedro_code_forensics/run.py
+
+\x004381639de273ed226a5ef861a4ee2f7cd1ff25e7\x002020-03-01T18:14:50+08:00\x00Tam Nguyen\x00Tam_Nguyen@McKinsey.com\x00Testing Again
+6\t4\tsrc/kedro_code_forensics/run.py
+
+\x0079c6a2a0e4a8f57fd81dd8f50531ec9a9f24bedb\x002020-03-01T19:14:58+08:00\x00Tam Nguyen\x00Tam_Nguyen@McKinsey.com\x00Last Test
+75\t0\tsrc/kedro_code_forensics/run.py
+"""  # noqa: 501
+    return raw_output
+
+
 @pytest.fixture
 def basic_git_file_commits():
     return [
@@ -120,3 +138,82 @@ def basic_cloc_data():
             "language": "Python",
         },
     }
+
+
+def _git(repository, *args):
+    subprocess.run(["git", "-C", repository, *args], check=True, stdout=subprocess.PIPE)
+
+
+def _commit(repository, message):
+    _git(repository, "add", "-A")
+    _git(
+        repository,
+        "-c",
+        "user.name=A",
+        "-c",
+        "user.email=a@b",
+        "commit",
+        "-q",
+        "-m",
+        message,
+    )
+
+
+@pytest.fixture
+def git_repository(tmp_path):
+    repository = str(tmp_path)
+    _git(repository, "init", "-q")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# a\n\nx = 1\n")
+    (tmp_path / "README.md").write_text("readme\n")
+    _commit(repository, "one")
+    _git(repository, "tag", "v1")
+    (tmp_path / "src" / "a.py").write_text("def f():\n    if x:\n        return 2\n")
+    _commit(repository, "two")
+    return repository
+
+
+@pytest.fixture
+def renamed_git_repository(tmp_path):
+    repository = str(tmp_path)
+
+    def write(filepath, lines):
+        path = tmp_path / filepath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"line = {line}\n" for line in range(lines)))
+
+    _git(repository, "init", "-q")
+    write("src/run.py", 20)
+    _commit(repository, "one")
+    write("src/run.py", 21)
+    write("README.md", 2)
+    _commit(repository, "two")
+    _git(repository, "mv", "src/run.py", "src/main.py")
+    _commit(repository, "three")
+    write("src/main.py", 22)
+    _commit(repository, "four")
+    write("README.md", 3)
+    _commit(repository, "five")
+    _git(repository, "mv", "src", "app")
+    _commit(repository, "six")
+    write("app/main.py", 23)
+    write("app/util.py", 5)
+    _commit(repository, "seven")
+    write("app/util.py", 6)
+    _commit(repository, "eight")
+    return repository
+
+
+@pytest.fixture
+def sparse_git_repository(git_repository):
+    # README.md is outside the sparse checkout, though left on disk,
+    # src/b.py is staged then deleted and src/c.py is never added
+    _git(git_repository, "update-index", "--skip-worktree", "README.md")
+    b_path = os.path.join(git_repository, "src", "b.py")
+    with open(b_path, "w") as f:
+        f.write("b = 1\n")
+    _git(git_repository, "add", "src/b.py")
+    os.remove(b_path)
+    with open(os.path.join(git_repository, "src", "c.py"), "w") as f:
+        f.write("c = 1\n")
+    return git_repository
@@ -0,0 +1,43 @@
+import os
+
+from kedro_code_forensics.io.blob_cache import BlobCache
+
+
+class TestBlobCache:
+    def test_persists_values_by_namespace(self, tmp_path):
+        cache_path = str(tmp_path / "cache" / "blobs.pickle")
+        cache = BlobCache(cache_path, "builtin", max_entries=10)
+        cache["abc"] = (1, 2, 3)
+        cache["def"] = None
+        cache.save()
+
+        reloaded = BlobCache(cache_path, "builtin", max_entries=10)
+        assert reloaded["abc"] == (1, 2, 3)
+        assert "def" in reloaded
+        assert reloaded["def"] is None
+        assert "abc" not in BlobCache(cache_path, "cloc", max_entries=10)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache_path = str(tmp_path / "blobs.pickle")
+        cache = BlobCache(cache_path, "builtin", max_entries=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        cache.save()
+
+        reloaded = BlobCache(cache_path, "builtin", max_entries=2)
+        assert "a" in reloaded
+        assert "b" not in reloaded
+        assert "c" in reloaded
+
+    def test_save_writes_through_a_temp_file_of_its_own(self, tmp_path):
+        cache_path = str(tmp_path / "blobs.pickle")
+        # As if another run were writing its own copy of the cache
+        (tmp_path / "blobs.pickle.tmp").mkdir()
+        cache = BlobCache(cache_path, "builtin", max_entries=10)
+        cache["abc"] = 1
+        cache.save()
+
+        assert BlobCache(cache_path, "builtin", max_entries=10)["abc"] == 1
+        assert sorted(os.listdir(tmp_path)) == ["blobs.pickle", "blobs.pickle.tmp"]
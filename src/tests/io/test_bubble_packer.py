@@ -91,3 +91,33 @@ class TestBubblePacker:
             "name": "root",
         }
         assert actual == expected
+
+    def test_aggregate_bubble_packs_with_color(self):
+        actual = _aggregate_bubble_packs([BubblePack(["dir1", "file1"], 5, 10, 2.5)])
+        expected = {
+            "dir1": {
+                "file1": {
+                    "/is_leaf": True,
+                    "name": "file1",
+                    "size": 5,
+                    "value": 10,
+                    "color": 2.5,
+                }
+            }
+        }
+        assert actual == expected
+
+    def test_save_diverging(self, tmp_path):
+        from kedro_code_forensics.io.bubble_packer import BubblePackerDataSet
+
+        filepath = tmp_path / "delta.html"
+        BubblePackerDataSet(str(filepath), save_args={"diverging": True}).save(
+            [
+                BubblePack(["a.py"], 10, 10, color=-40),
+                BubblePack(["b.py"], 10, 10, color=20),
+            ]
+        )
+
+        html = filepath.read_text()
+        assert ".domain([-40, 0, 40])" in html
+        assert "diverging" not in html
@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+
+
 class TestClocFile:
     def test_parse_cloc_files(self, basic_cloc_data):
         from kedro_code_forensics.io.cloc_file import _parse_cloc_output, ClocFile
@@ -19,3 +24,168 @@ class TestClocFile:
         ]
 
         assert actual == expected
+
+    def test_iter_cloc_output_in_chunks(self, basic_cloc_data):
+        from kedro_code_forensics.io.cloc_file import (
+            _iter_cloc_output,
+            _parse_cloc_output,
+        )
+
+        raw_json = json.dumps(basic_cloc_data, indent=2)
+        chunks = [raw_json[i : i + 7] for i in range(0, len(raw_json), 7)]
+
+        actual = list(_iter_cloc_output(".", chunks))
+
+        assert actual == _parse_cloc_output("./", basic_cloc_data)
+
+    def test_iter_cloc_output_strips_only_prefix(self):
+        from kedro_code_forensics.io.cloc_file import ClocFile, _iter_cloc_output
+
+        raw_json = json.dumps(
+            {
+                "header": {"n_files": 2},
+                "/repo/src/repo/a.py": {
+                    "blank": 1,
+                    "comment": 2,
+                    "code": 3,
+                    "language": "Python",
+                },
+                "SUM": {"blank": 1, "comment": 2, "code": 3, "nFiles": 1},
+            }
+        )
+
+        actual = list(_iter_cloc_output("/repo", [raw_json]))
+
+        assert actual == [ClocFile("src/repo/a.py", 1, 2, 3, "Python")]
+
+    def test_load_cached_counts_only_new_blobs(self, tmp_path, mocker):
+        from kedro_code_forensics.io import cloc_file
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+        from kedro_code_forensics.io.line_counter import LineCount
+
+        mocker.patch.object(
+            cloc_file, "select_files", return_value=["a.py", "b.py", "notes.txt"]
+        )
+        blob_ids = mocker.patch.object(cloc_file, "working_tree_blob_ids")
+        count_listed = mocker.patch.object(ClocFileDataSet, "_count_listed")
+        data_set = ClocFileDataSet(
+            "repo", counter="builtin", cache_path=str(tmp_path / "lines.pickle")
+        )
+
+        blob_ids.return_value = {"a.py": "1", "b.py": "2", "notes.txt": "3"}
+        count_listed.return_value = [
+            ("a.py", LineCount(1, 2, 3, "Python")),
+            ("b.py", LineCount(4, 5, 6, "Python")),
+        ]
+        assert data_set.load() == [
+            ClocFile("a.py", 1, 2, 3, "Python"),
+            ClocFile("b.py", 4, 5, 6, "Python"),
+        ]
+        count_listed.assert_called_once_with(["a.py", "b.py", "notes.txt"])
+
+        count_listed.reset_mock()
+        blob_ids.return_value = {"a.py": "1", "b.py": "4", "notes.txt": "3"}
+        count_listed.return_value = [("b.py", LineCount(0, 0, 1, "Python"))]
+        assert data_set.load() == [
+            ClocFile("a.py", 1, 2, 3, "Python"),
+            ClocFile("b.py", 0, 0, 1, "Python"),
+        ]
+        count_listed.assert_called_once_with(["b.py"])
+
+    def test_load_cached_keys_counts_by_extension(self, tmp_path):
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x = 1\n# note\n")
+        (tmp_path / "src" / "dup.js").write_text("x = 1\n# note\n")
+        data_set = ClocFileDataSet(
+            str(tmp_path),
+            counter="builtin",
+            cache_path=str(tmp_path / "cache" / "lines.pickle"),
+        )
+
+        expected = [
+            ClocFile("src/a.py", 0, 1, 1, "Python"),
+            ClocFile("src/dup.js", 0, 0, 2, "JavaScript"),
+        ]
+        assert sorted(data_set.load()) == expected
+        # The second load is answered from the cache
+        assert sorted(data_set.load()) == expected
+
+    def test_load_cached_keeps_counts_of_skipped_copies(self, tmp_path, mocker):
+        from kedro_code_forensics.io import cloc_file
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+        from kedro_code_forensics.io.line_counter import LineCount
+
+        mocker.patch.object(cloc_file, "select_files", return_value=["a.py", "b.py"])
+        mocker.patch.object(
+            cloc_file, "working_tree_blob_ids", return_value={"a.py": "1", "b.py": "1"}
+        )
+        # cloc reports only one of two files with the same content
+        count_listed = mocker.patch.object(
+            ClocFileDataSet,
+            "_count_listed",
+            return_value=[("a.py", LineCount(1, 2, 3, "Python"))],
+        )
+        data_set = ClocFileDataSet("repo", cache_path=str(tmp_path / "lines.pickle"))
+
+        expected = [
+            ClocFile("a.py", 1, 2, 3, "Python"),
+            ClocFile("b.py", 1, 2, 3, "Python"),
+        ]
+        assert data_set.load() == expected
+        count_listed.assert_called_once_with(["a.py", "b.py"])
+        assert data_set.load() == expected
+        count_listed.assert_called_with([])
+
+    def test_count_listed_with_cloc_counts_copies(self, mocker):
+        from kedro_code_forensics.io import cloc_file
+        from kedro_code_forensics.io.cloc_file import ClocFileDataSet
+
+        stream_cloc = mocker.patch.object(
+            cloc_file, "_stream_cloc", return_value=["{}"]
+        )
+
+        list(ClocFileDataSet("repo")._count_listed_with_cloc(["a.py"]))
+
+        assert "--skip-uniqueness" in stream_cloc.call_args[0][0]
+
+    def test_load_tracked_only_with_builtin_counter(self, sparse_git_repository):
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        data_set = ClocFileDataSet(
+            sparse_git_repository, counter="builtin", tracked_only=True
+        )
+
+        assert data_set.load() == [ClocFile("src/a.py", 0, 0, 3, "Python")]
+
+    def test_load_tracked_only_with_cloc(self, sparse_git_repository, mocker):
+        from kedro_code_forensics.io import cloc_file
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        a_path = os.path.join(os.path.abspath(sparse_git_repository), "src", "a.py")
+        listed = []
+
+        def stream_cloc(command):
+            list_file = command[-1][len("--list-file=") :]
+            with open(list_file) as f:
+                listed.extend(f.read().splitlines())
+            return [
+                json.dumps(
+                    {
+                        a_path: {
+                            "blank": 0,
+                            "comment": 0,
+                            "code": 3,
+                            "language": "Python",
+                        }
+                    }
+                )
+            ]
+
+        mocker.patch.object(cloc_file, "_stream_cloc", side_effect=stream_cloc)
+        data_set = ClocFileDataSet(sparse_git_repository, tracked_only=True)
+
+        assert data_set.load() == [ClocFile("src/a.py", 0, 0, 3, "Python")]
+        assert listed == [a_path]
@@ -0,0 +1,63 @@
+from kedro_code_forensics.io.cyclomatic import (
+    CyclomaticComplexity,
+    CyclomaticComplexityDataSet,
+    FunctionComplexity,
+    cyclomatic_complexity,
+)
+
+PYTHON_SOURCE = b"""\
+import os
+
+if os.name == "nt":
+    SEP = "\\\\"
+
+
+def f(x):
+    if x and x > 1 or x < -1:
+        return [y for y in range(x) if y % 2]
+    elif x:
+        return 1
+    return 0
+
+
+class A:
+    def g(self):
+        def h():
+            while True:
+                pass
+
+        try:
+            return h()
+        except ValueError:
+            return None
+"""
+
+
+class TestCyclomaticComplexity:
+    def test_cyclomatic_complexity(self):
+        actual = cyclomatic_complexity(PYTHON_SOURCE)
+
+        assert actual.functions == (
+            FunctionComplexity("f", 7, 7),
+            FunctionComplexity("A.g", 16, 2),
+            FunctionComplexity("A.g.h", 17, 2),
+        )
+        assert actual.complexity == 2 + 7 + 2 + 2
+
+    def test_unparsable_source(self):
+        assert cyclomatic_complexity(b"def f(:\n") is None
+
+    def test_load_cached(self, git_repository, tmp_path, mocker):
+        cache_path = str(tmp_path / "cache" / "cyclomatic.pickle")
+        data_set = CyclomaticComplexityDataSet(
+            git_repository, cache_path=cache_path, workers=2
+        )
+        expected = {
+            "src/a.py": CyclomaticComplexity(3, (FunctionComplexity("f", 1, 2),))
+        }
+
+        assert data_set.load() == expected
+
+        measure = mocker.spy(data_set, "_measure")
+        assert data_set.load() == expected
+        measure.assert_called_once_with([])
@@ -6,3 +6,298 @@ class TestGitLogDataSet:
         expected = basic_git_file_commits
 
         assert actual == expected
+
+    def test_iter_git_file_commits(self, raw_git_log, basic_git_file_commits):
+        from kedro_code_forensics.io.git_file_commit import _iter_git_file_commits
+
+        lines = iter(raw_git_log.splitlines(keepends=True))
+        actual = _iter_git_file_commits(lines)
+
+        assert next(actual) == basic_git_file_commits[0]
+        assert list(actual) == basic_git_file_commits[1:]
+
+    def test_load_cached(self, tmp_path, basic_git_file_commits, mocker):
+        from kedro_code_forensics.io import git_file_commit
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        run_git = mocker.patch.object(git_file_commit, "_run_git")
+        is_ancestor = mocker.patch.object(git_file_commit, "_is_ancestor")
+        parse_git_log = mocker.patch.object(
+            GitFileCommitDataSet, "_parse_git_log", autospec=True
+        )
+        data_set = GitFileCommitDataSet(
+            "repo", cache_path=str(tmp_path / "cache" / "commits.pickle")
+        )
+
+        run_git.return_value = "old"
+        parse_git_log.return_value = basic_git_file_commits[1:]
+        assert data_set.load() == basic_git_file_commits[1:]
+        parse_git_log.assert_called_once_with(data_set, "old")
+
+        parse_git_log.reset_mock()
+        assert data_set.load() == basic_git_file_commits[1:]
+        parse_git_log.assert_not_called()
+
+        run_git.return_value = "new"
+        is_ancestor.return_value = True
+        parse_git_log.return_value = basic_git_file_commits[:1]
+        assert data_set.load() == basic_git_file_commits
+        parse_git_log.assert_called_once_with(data_set, "old..new")
+
+        parse_git_log.reset_mock()
+        run_git.return_value = "rewritten"
+        is_ancestor.return_value = False
+        parse_git_log.return_value = basic_git_file_commits[2:]
+        assert data_set.load() == basic_git_file_commits[2:]
+        parse_git_log.assert_called_once_with(data_set, "rewritten")
+
+    def test_load_cached_columnar(self, tmp_path, basic_git_file_commits, mocker):
+        from kedro_code_forensics.io import git_file_commit
+        from kedro_code_forensics.io.git_file_commit import (
+            GitFileCommitDataSet,
+            GitFileCommitTable,
+        )
+
+        run_git = mocker.patch.object(git_file_commit, "_run_git")
+        mocker.patch.object(git_file_commit, "_is_ancestor", return_value=True)
+        parse_git_log = mocker.patch.object(GitFileCommitDataSet, "_parse_git_log")
+        to_commits = mocker.spy(GitFileCommitTable, "to_commits")
+        data_set = GitFileCommitDataSet(
+            "repo", cache_path=str(tmp_path / "commits.pickle"), columnar=True
+        )
+
+        run_git.return_value = "old"
+        parse_git_log.return_value = basic_git_file_commits[2:]
+        data_set.load()
+        run_git.return_value = "new"
+        parse_git_log.return_value = basic_git_file_commits[:2]
+        data_set.load()
+        parse_git_log.reset_mock()
+        actual = data_set.load()
+
+        parse_git_log.assert_not_called()
+        to_commits.assert_not_called()
+        assert isinstance(actual, GitFileCommitTable)
+        assert list(actual.to_commits()) == basic_git_file_commits
+
+    def test_load_cached_beside_another_writer(self, tmp_path, git_repository):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        # As if another run were writing its own copy of the cache
+        (tmp_path / "cache" / "commits.pickle.tmp").mkdir(parents=True)
+        data_set = GitFileCommitDataSet(
+            git_repository, cache_path=str(tmp_path / "cache" / "commits.pickle")
+        )
+
+        expected = GitFileCommitDataSet(git_repository).load()
+        assert data_set.load() == expected
+        # The second load is answered from the cache
+        assert data_set.load() == expected
+
+    def test_load_revision_range(self, git_repository):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        def filepaths(**kwargs):
+            git_file_commits = GitFileCommitDataSet(git_repository, **kwargs).load()
+            return sorted(file_commit.filepath for file_commit in git_file_commits)
+
+        assert filepaths() == ["README.md", "src/a.py", "src/a.py"]
+        assert filepaths(revision_range="v1") == ["README.md", "src/a.py"]
+        assert filepaths(revision_range="v1..HEAD", streaming=True) == ["src/a.py"]
+        assert filepaths(revision_range="HEAD..v1") == []
+
+    def test_load_parallel_matches_serial(self, renamed_git_repository):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        for track_renames in (False, True):
+            serial = GitFileCommitDataSet(
+                renamed_git_repository, track_renames=track_renames
+            ).load()
+            # Two workers make eight shards, so the eight commits are one per
+            # shard and every rename sits on a shard boundary
+            parallel = GitFileCommitDataSet(
+                renamed_git_repository, track_renames=track_renames, workers=2
+            ).load()
+
+            assert parallel == serial
+
+        assert {file_commit.filepath for file_commit in parallel} == {
+            "README.md",
+            "app/main.py",
+            "app/util.py",
+        }
+        assert len(parallel) == 10
+
+    def test_split_shards(self):
+        from kedro_code_forensics.io.git_file_commit import _split_shards
+
+        revisions = ["a", "b", "c", "d", "e"]
+
+        assert _split_shards(revisions, 2) == [["a", "b", "c"], ["d", "e"]]
+        assert _split_shards(revisions, 8) == [["a"], ["b"], ["c"], ["d"], ["e"]]
+        assert _split_shards([], 4) == []
+
+    def test_parse_separated_git_log_output(
+        self, separated_raw_git_log, basic_git_file_commits
+    ):
+        from kedro_code_forensics.io.git_file_commit import _parse_git_log_output
+
+        actual = _parse_git_log_output(separated_raw_git_log)
+        expected = basic_git_file_commits
+
+        assert actual == expected
+
+    def test_parse_separated_header_with_quotes_and_commas(self):
+        from kedro_code_forensics.io.git_file_commit import (
+            Committer,
+            _parse_git_log_output,
+        )
+
+        raw_output = (
+            '\x00abc\x002020-03-01T18:14:49-02:30\x00O\'Neil, "Bob"\x00bob@example.com'
+            '\x00Merge "feature", part 2\n3\t-\tREADME.md\n'
+        )
+        (actual,) = _parse_git_log_output(raw_output)
+
+        assert actual.committer == Committer('O\'Neil, "Bob"', "bob@example.com")
+        assert actual.message == 'Merge "feature", part 2'
+        assert actual.date.isoformat() == "2020-03-01T18:14:49-02:30"
+        assert (actual.insertions, actual.deletions) == (3, 0)
+
+    def test_git_file_commit_table(self, basic_git_file_commits):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitTable
+
+        table = GitFileCommitTable.from_commits(iter(basic_git_file_commits))
+
+        assert table.commit_ids.tolist() == [0, 0, 1, 2]
+        assert table.filepath_ids.tolist() == [0, 1, 1, 1]
+        assert table.committer_ids.tolist() == [0, 0, 0, 0]
+        assert table.timestamps.tolist() == [
+            int(file_commit.date.timestamp()) for file_commit in basic_git_file_commits
+        ]
+        assert table.filepaths == [
+            "src/kedro_code_forensics/io/git_file_commit.py",
+            "src/kedro_code_forensics/run.py",
+        ]
+        assert table.messages == ["Testing", "Testing Again", "Last Test"]
+        assert list(table.to_commits()) == basic_git_file_commits
+
+    def test_concatenate_git_file_commit_tables(self, basic_git_file_commits):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitTable
+
+        actual = GitFileCommitTable.concatenate(
+            [
+                GitFileCommitTable.from_commits(basic_git_file_commits[:2]),
+                GitFileCommitTable.from_commits(basic_git_file_commits[2:]),
+            ]
+        )
+        expected = GitFileCommitTable.from_commits(basic_git_file_commits)
+
+        for field, expected_column in zip(expected._fields, expected):
+            assert list(getattr(actual, field)) == list(expected_column)
+        assert GitFileCommitTable.concatenate([]).commit_ids.tolist() == []
+
+    def test_git_log_command_pathspecs(self):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        def pathspecs(**kwargs):
+            git_command = GitFileCommitDataSet("repo", **kwargs)._git_log_command()
+            return git_command[git_command.index("--") + 1 :]
+
+        assert "--" not in GitFileCommitDataSet("repo")._git_log_command()
+        assert pathspecs(included_paths=["src"]) == ["src"]
+        assert pathspecs(excluded_paths=["venv", ":(exclude,glob)**/*.lock"]) == [
+            ":/",
+            ":(exclude)venv",
+            ":(exclude,glob)**/*.lock",
+        ]
+        assert pathspecs(included_paths=["src"], excluded_paths=["src/gen"]) == [
+            "src",
+            ":(exclude)src/gen",
+        ]
+        assert pathspecs(excluded_paths=[":(glob)**/*.lock", ":!venv", ":/docs"]) == [
+            ":/",
+            ":(glob,exclude)**/*.lock",
+            ":(exclude)venv",
+            ":(top,exclude)docs",
+        ]
+
+    def test_load_excluded_glob_pathspec(self, git_repository):
+        from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+
+        git_file_commits = GitFileCommitDataSet(
+            git_repository, excluded_paths=[":(glob)**/*.md"]
+        ).load()
+
+        assert {file_commit.filepath for file_commit in git_file_commits} == {
+            "src/a.py"
+        }
+
+    def test_parse_git_log_output_with_commit_filter(
+        self, separated_raw_git_log, basic_git_file_commits
+    ):
+        import re
+
+        from kedro_code_forensics.io.git_file_commit import (
+            CommitFilter,
+            _parse_git_log_output,
+        )
+
+        def parse(**kwargs):
+            return _parse_git_log_output(separated_raw_git_log, CommitFilter(**kwargs))
+
+        assert parse() == basic_git_file_commits
+        assert parse(max_files=1) == basic_git_file_commits[2:]
+        assert parse(max_files=2) == basic_git_file_commits
+        assert (
+            parse(excluded_messages=re.compile("^Last")) == basic_git_file_commits[:3]
+        )
+        assert parse(excluded_authors=re.compile("<Tam_Nguyen@McKinsey.com>")) == []
+
+    def test_split_rename(self):
+        from kedro_code_forensics.io.git_file_commit import _split_rename
+
+        assert _split_rename("src/run.py") is None
+        assert _split_rename("old.py => new.py") == ("old.py", "new.py")
+        assert _split_rename("src/{io => nodes}/run.py") == (
+            "src/io/run.py",
+            "src/nodes/run.py",
+        )
+        assert _split_rename("src/{ => nested}/run.py") == (
+            "src/run.py",
+            "src/nested/run.py",
+        )
+        assert _split_rename("{src => }/run.py") == ("src/run.py", "run.py")
+
+    def test_resolve_renames(self, basic_git_file_commits):
+        from kedro_code_forensics.io.git_file_commit import _resolve_renames
+
+        newest, renamed, moved, oldest = basic_git_file_commits
+        git_file_commits = [
+            newest._replace(filepath="app/main.py"),
+            renamed._replace(filepath="{src => app}/main.py"),
+            moved._replace(filepath="src/{run.py => main.py}"),
+            oldest._replace(filepath="src/run.py"),
+        ]
+
+        actual = [
+            file_commit.filepath for file_commit in _resolve_renames(git_file_commits)
+        ]
+
+        assert actual == ["app/main.py"] * 4
+
+    def test_resolve_renames_of_reused_path(self, basic_git_file_commits):
+        from kedro_code_forensics.io.git_file_commit import _resolve_renames
+
+        newest, renamed, _, oldest = basic_git_file_commits
+        git_file_commits = [
+            newest._replace(filepath="run.py"),
+            renamed._replace(filepath="run.py => main.py"),
+            oldest._replace(filepath="run.py"),
+        ]
+
+        actual = [
+            file_commit.filepath for file_commit in _resolve_renames(git_file_commits)
+        ]
+
+        assert actual == ["run.py", "main.py", "main.py"]
@@ -0,0 +1,75 @@
+import subprocess
+
+import pytest
+
+
+class TestGitObjects:
+    def test_tree_blob_ids(self, git_repository):
+        from kedro_code_forensics.io.git_objects import tree_blob_ids
+
+        blob_ids = tree_blob_ids(git_repository, "v1")
+
+        assert sorted(blob_ids) == ["README.md", "src/a.py"]
+        assert all(len(blob_id) == 40 for blob_id in blob_ids.values())
+
+    def test_tracked_files(self, sparse_git_repository):
+        from kedro_code_forensics.io.git_objects import tracked_files
+
+        assert tracked_files(sparse_git_repository) == ["src/a.py"]
+
+    def test_blob_reader(self, git_repository):
+        from kedro.io import DataSetError
+
+        from kedro_code_forensics.io.git_objects import BlobReader, tree_blob_ids
+
+        blob_ids = tree_blob_ids(git_repository, "v1")
+
+        with BlobReader(git_repository) as reader:
+            blobs = reader.iter_blobs([blob_ids["src/a.py"], blob_ids["README.md"]])
+            assert next(blobs) == (blob_ids["src/a.py"], b"# a\n\nx = 1\n")
+            blobs.close()
+
+            assert list(reader.iter_blobs([blob_ids["README.md"]])) == [
+                (blob_ids["README.md"], b"readme\n")
+            ]
+            with pytest.raises(DataSetError):
+                list(reader.iter_blobs(["0" * 40]))
+
+    def test_load_cloc_files_at_ref(self, git_repository, tmp_path):
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        data_set = ClocFileDataSet(
+            git_repository, ref="v1", cache_path=str(tmp_path / "lines.pickle")
+        )
+
+        expected = [
+            ClocFile("README.md", 0, 0, 1, "Markdown"),
+            ClocFile("src/a.py", 1, 1, 1, "Python"),
+        ]
+        assert data_set.load() == expected
+        assert data_set.load() == expected
+
+    def test_load_cloc_files_at_ref_counts_copies_by_language(self, tmp_path):
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        repository = tmp_path / "repository"
+        repository.mkdir()
+        for filename in ("a.py", "b.py", "dup.js"):
+            (repository / filename).write_text("x = 1\n# note\n")
+        for args in (
+            ["init", "-q"],
+            ["add", "."],
+            ["-c", "user.name=A", "-c", "user.email=a@b", "commit", "-q", "-m", "m"],
+        ):
+            subprocess.run(["git", "-C", str(repository), *args], check=True)
+        data_set = ClocFileDataSet(
+            str(repository), ref="HEAD", cache_path=str(tmp_path / "lines.pickle")
+        )
+
+        expected = [
+            ClocFile("a.py", 0, 1, 1, "Python"),
+            ClocFile("b.py", 0, 1, 1, "Python"),
+            ClocFile("dup.js", 0, 0, 2, "JavaScript"),
+        ]
+        assert data_set.load() == expected
+        assert data_set.load() == expected
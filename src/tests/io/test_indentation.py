@@ -0,0 +1,44 @@
+import pytest
+
+from kedro_code_forensics.io.indentation import (
+    IndentationComplexity,
+    IndentationComplexityDataSet,
+    indentation_complexity,
+)
+
+
+class TestIndentationComplexity:
+    def test_logical_levels(self):
+        content = b"def f():\n    if x:\n\n\treturn 1\n  y = 2\n"
+
+        actual = indentation_complexity(content)
+
+        assert actual.lines == 5
+        assert actual.total == 2.5
+        assert actual.mean == 0.625
+        assert actual.max == 1
+        assert actual.sd == pytest.approx(0.4146, abs=1e-4)
+
+    def test_blank_file(self):
+        assert indentation_complexity(b"\n  \n") == IndentationComplexity(
+            2, 0.0, 0.0, 0.0, 0.0
+        )
+
+    def test_crlf_and_no_final_newline(self):
+        content = b"if x:\r\n\ty = 1\r\n  \r\n\t\tz"
+
+        actual = indentation_complexity(content, tab_size=2)
+
+        assert actual == IndentationComplexity(4, 3.0, 1.0, 2.0, actual.sd)
+        assert actual.sd == pytest.approx(0.8165, abs=1e-4)
+
+    def test_load_data_set(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "src" / "a.py").write_bytes(b"def f():\n    return 1\n")
+        (tmp_path / "src" / "image.png").write_bytes(b"\x89PNG")
+        (tmp_path / "venv" / "lib.py").write_bytes(b"x = 1\n")
+
+        actual = IndentationComplexityDataSet(str(tmp_path), workers=2).load()
+
+        assert actual == {"src/a.py": IndentationComplexity(2, 1.0, 0.5, 1.0, 0.5)}
@@ -0,0 +1,101 @@
+from kedro_code_forensics.io.line_counter import (
+    LANGUAGES,
+    LineCount,
+    count_blob,
+    count_file,
+    count_files,
+    count_line_kinds,
+    filter_files,
+    walk_files,
+)
+
+PYTHON_SOURCE = b'''\
+"""
+Module docstring
+"""
+import os  # trailing comments are code
+
+# A comment
+
+def f():
+    """One line docstring"""
+    return os.sep
+'''
+
+
+class TestLineCounter:
+    def test_count_line_kinds(self):
+        actual = count_line_kinds(PYTHON_SOURCE.splitlines(), LANGUAGES[".py"])
+        assert actual == LineCount(blank=2, comment=5, code=3, language="Python")
+
+    def test_count_string_constant_as_cloc_does(self):
+        source = (
+            b'QUERY = """\nselect 1\n"""\ny = 1\nz = 2\n\n\ndef f():\n    return y\n'
+        )
+        actual = count_line_kinds(source.splitlines(), LANGUAGES[".py"])
+        # The counts cloc reports for the same file
+        assert actual == LineCount(blank=2, comment=2, code=5, language="Python")
+
+    def test_count_blank_lines_in_blocks_as_blank(self):
+        source = b'def f():\n    """\n    Docstring\n\n    More\n    """\n'
+        actual = count_line_kinds(source.splitlines(), LANGUAGES[".py"])
+        assert actual == LineCount(blank=1, comment=4, code=1, language="Python")
+
+    def test_count_c_style_block_comments(self):
+        source = b"/* one\n * two\n */\nint x; // code\n\n// comment\n"
+        actual = count_line_kinds(source.splitlines(), LANGUAGES[".c"])
+        assert actual == LineCount(blank=1, comment=4, code=1, language="C")
+
+    def test_walk_and_count_files(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "src" / "module.py").write_bytes(PYTHON_SOURCE)
+        (tmp_path / "src" / "empty.py").write_bytes(b"")
+        (tmp_path / "src" / "image.png").write_bytes(b"\x89PNG")
+        (tmp_path / "venv" / "lib.py").write_bytes(PYTHON_SOURCE)
+
+        filepaths = sorted(walk_files(str(tmp_path), ["venv"]))
+        assert filepaths == ["src/empty.py", "src/module.py"]
+
+        actual = list(count_files(str(tmp_path), filepaths, workers=2))
+        assert actual == [("src/module.py", LineCount(2, 5, 3, "Python"))]
+
+    def test_skips_files_that_cannot_be_read(self, tmp_path):
+        from kedro_code_forensics.io.cloc_file import ClocFile, ClocFileDataSet
+
+        (tmp_path / "a.py").write_bytes(PYTHON_SOURCE)
+        (tmp_path / "b.py").symlink_to(tmp_path / "missing.py")
+
+        actual = ClocFileDataSet(str(tmp_path), counter="builtin").load()
+        assert actual == [ClocFile("a.py", 2, 5, 3, "Python")]
+
+    def test_count_blob_as_count_file_does(self, tmp_path):
+        # Only a newline ends a line, not a carriage return or a form feed
+        content = b"x = 1\rimport os\n\x0c\n# c\r\n"
+        (tmp_path / "a.py").write_bytes(content)
+
+        expected = LineCount(1, 1, 1, "Python")
+        assert count_file(str(tmp_path / "a.py")) == expected
+        assert count_blob("a.py", content) == expected
+
+    def test_filter_files(self):
+        filepaths = [
+            "setup.py",
+            "src/module.py",
+            "src/venv_tools.py",
+            "venv/lib/site.py",
+            "docs/venv/notes.md",
+            "data/model.pkl",
+        ]
+
+        assert list(filter_files(filepaths, ["venv"], True)) == [
+            "setup.py",
+            "src/module.py",
+            "src/venv_tools.py",
+        ]
+        assert list(filter_files(filepaths, ["venv"], False)) == [
+            "setup.py",
+            "src/module.py",
+            "src/venv_tools.py",
+            "data/model.pkl",
+        ]
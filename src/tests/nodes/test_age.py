@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+)
+from kedro_code_forensics.nodes.age import (
+    SECONDS_PER_MONTH,
+    CodeAge,
+    DirectoryCodeAge,
+    generate_code_age,
+    generate_directory_code_age,
+)
+
+
+@pytest.fixture
+def aging_git_file_commits():
+    committer = Committer("A", "a@b")
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()
+    changes = [
+        (0, "src/a.py"),
+        (0, "src/b.py"),
+        (1, "README.md"),
+        (2, "src/a.py"),
+        (4, "src/c.py"),
+    ]
+    return [
+        GitFileCommit(
+            f"h{months}",
+            datetime.fromtimestamp(base + months * SECONDS_PER_MONTH, timezone.utc),
+            committer,
+            "m",
+            filepath,
+            1,
+            0,
+        )
+        for months, filepath in reversed(changes)
+    ]
+
+
+class TestCodeAge:
+    def test_generate_code_age(self, aging_git_file_commits):
+        actual = generate_code_age(aging_git_file_commits)
+
+        assert [(age.filepath, round(age.age_months)) for age in actual] == [
+            ("src/c.py", 0),
+            ("src/a.py", 2),
+            ("README.md", 3),
+            ("src/b.py", 4),
+        ]
+        assert actual == generate_code_age(
+            GitFileCommitTable.from_commits(aging_git_file_commits)
+        )
+        assert generate_code_age([]) == []
+
+    def test_generate_directory_code_age(self):
+        code_ages = [
+            CodeAge("src/a.py", 0, 1.0),
+            CodeAge("src/b.py", 0, 2.0),
+            CodeAge("src/c.py", 0, 6.0),
+            CodeAge("README.md", 0, 3.0),
+        ]
+
+        actual = generate_directory_code_age(code_ages)
+
+        assert actual == [
+            DirectoryCodeAge(".", 1, 3.0, 3.0, 3.0, 3.0, 3.0),
+            DirectoryCodeAge("src", 3, 1.0, 1.5, 2.0, 4.0, 6.0),
+        ]
+        assert isinstance(actual[0].files, int)
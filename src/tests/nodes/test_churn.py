@@ -0,0 +1,79 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+)
+from kedro_code_forensics.nodes.churn import (
+    ChurnPoint,
+    generate_directory_churn,
+    generate_file_churn,
+)
+
+
+@pytest.fixture
+def churning_git_file_commits():
+    committer = Committer("A", "a@b")
+    changes = [
+        # Wednesday 1 January and Sunday 5 January 2020 share a week
+        (datetime(2020, 1, 1), "src/a.py", 1, 1),
+        (datetime(2020, 1, 5), "src/a.py", 2, 0),
+        (datetime(2020, 1, 8), "src/b.py", 5, 5),
+        (datetime(2020, 1, 20), "src/a.py", 6, 4),
+        (datetime(2020, 2, 3), "README.md", 1, 0),
+    ]
+    return [
+        GitFileCommit(
+            f"h{i}",
+            commit_date.replace(tzinfo=timezone.utc),
+            committer,
+            "m",
+            filepath,
+            insertions,
+            deletions,
+        )
+        for i, (commit_date, filepath, insertions, deletions) in enumerate(changes)
+    ]
+
+
+class TestChurn:
+    def test_generate_file_churn_by_week(self, churning_git_file_commits):
+        actual = generate_file_churn(churning_git_file_commits, "week", 3)
+
+        assert actual == [
+            ChurnPoint("src/a.py", date(2019, 12, 30), 2, 3, 1, 0.0),
+            # Churn of 0, 0 and 10 over the three weeks to 20 January
+            ChurnPoint("src/a.py", date(2020, 1, 20), 1, 6, 4, 5.0),
+            ChurnPoint("src/b.py", date(2020, 1, 6), 1, 5, 5, 10.0),
+            ChurnPoint("README.md", date(2020, 2, 3), 1, 1, 0, 0.5),
+        ]
+
+    def test_generate_directory_churn_by_month(self, churning_git_file_commits):
+        table = GitFileCommitTable.from_commits(churning_git_file_commits)
+
+        actual = generate_directory_churn(table, "month", 2)
+
+        assert actual == [
+            ChurnPoint("src", date(2020, 1, 1), 4, 14, 10, 0.0),
+            ChurnPoint(".", date(2020, 2, 1), 1, 1, 0, 1.0),
+        ]
+
+    def test_generate_directory_churn_counts_commits(self):
+        committer = Committer("A", "a@b")
+        commit_date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        git_file_commits = [
+            GitFileCommit("h1", commit_date, committer, "m", "src/a.py", 1, 0),
+            GitFileCommit("h1", commit_date, committer, "m", "src/b.py", 2, 0),
+            GitFileCommit("h2", commit_date, committer, "m", "src/a.py", 3, 0),
+        ]
+
+        actual = generate_directory_churn(git_file_commits, "month", 1)
+
+        assert actual == [ChurnPoint("src", date(2020, 1, 1), 2, 6, 0, 0.0)]
+
+    def test_unknown_period(self, churning_git_file_commits):
+        with pytest.raises(ValueError):
+            generate_file_churn(churning_git_file_commits, "day", 2)
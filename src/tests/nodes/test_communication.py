@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+from kedro_code_forensics.io.git_file_commit import Committer, GitFileCommit
+from kedro_code_forensics.nodes.communication import (
+    AuthorCommunication,
+    generate_author_communication,
+    report_author_communication_edges,
+)
+
+ANN = Committer("Ann", "ann@example.com")
+BOB = Committer("Bob", "bob@example.com")
+CY = Committer("Cy", "cy@example.com")
+
+
+class TestCommunication:
+    def test_generate_author_communication(self):
+        date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        changes = [
+            (ANN, "a.py"),
+            (ANN, "a.py"),
+            (ANN, "b.py"),
+            (BOB, "a.py"),
+            (BOB, "b.py"),
+            (CY, "b.py"),
+            (CY, "c.py"),
+            (CY, "d.py"),
+        ]
+        git_file_commits = [
+            GitFileCommit(f"h{i}", date, committer, "m", filepath, 1, 0)
+            for i, (committer, filepath) in enumerate(changes)
+        ]
+
+        actual = generate_author_communication(git_file_commits, 1)
+
+        assert actual == [
+            AuthorCommunication(ANN, BOB, 2, 100.0),
+            AuthorCommunication(ANN, CY, 1, 40.0),
+            AuthorCommunication(BOB, CY, 1, 40.0),
+        ]
+        assert generate_author_communication(git_file_commits, 2) == actual[:1]
+
+    def test_report_author_communication_edges(self):
+        actual = report_author_communication_edges(
+            [AuthorCommunication(ANN, BOB, 2, 100.0)]
+        )
+
+        assert actual.to_dict("records") == [
+            {
+                "author": "Ann <ann@example.com>",
+                "peer": "Bob <bob@example.com>",
+                "shared_files": 2,
+                "strength": 100.0,
+            }
+        ]
+        assert list(report_author_communication_edges([]).columns) == [
+            "author",
+            "peer",
+            "shared_files",
+            "strength",
+        ]
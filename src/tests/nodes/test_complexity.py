@@ -0,0 +1,60 @@
+from kedro_code_forensics.io.git_file_commit import GitFileCommitDataSet
+from kedro_code_forensics.nodes.complexity import generate_complexity_trends
+from kedro_code_forensics.nodes.transformations import HotSpotData
+
+
+class TestComplexityTrends:
+    def test_generate_complexity_trends(self, git_repository):
+        git_file_commits = GitFileCommitDataSet(git_repository).load()
+        hot_spots = [
+            HotSpotData("README.md", 1, 1, 1),
+            HotSpotData("src/a.py", 2, 3, 6),
+        ]
+
+        actual = generate_complexity_trends(
+            hot_spots, git_file_commits, git_repository, top_n=1
+        )
+
+        assert list(actual) == ["src/a.py"]
+        trend = actual["src/a.py"]
+        assert [point.lines for point in trend] == [3, 3]
+        assert [point.total for point in trend] == [0, 3]
+        assert [point.max for point in trend] == [0, 2]
+        assert trend[0].date <= trend[1].date
+        assert trend[1].date.tzinfo is not None
+
+    def test_skips_missing_revisions(self, git_repository):
+        git_file_commits = GitFileCommitDataSet(git_repository).load()
+        # A file deleted in a commit has no content at that revision
+        hot_spots = [HotSpotData("src/a.py", 2, 3, 6)]
+        table = [
+            file_commit._replace(filepath="src/gone.py")
+            for file_commit in git_file_commits
+        ]
+
+        actual = generate_complexity_trends(
+            hot_spots + [HotSpotData("src/gone.py", 1, 1, 10)],
+            table,
+            git_repository,
+            top_n=1,
+        )
+
+        assert actual == {"src/gone.py": []}
+
+    def test_caches_complexities_by_blob_id(self, git_repository, tmp_path, mocker):
+        git_file_commits = GitFileCommitDataSet(git_repository).load()
+        hot_spots = [HotSpotData("src/a.py", 2, 3, 6)]
+        cache_path = str(tmp_path / "cache.pickle")
+
+        expected = generate_complexity_trends(
+            hot_spots, git_file_commits, git_repository, 1, cache_path
+        )
+        measure = mocker.patch(
+            "kedro_code_forensics.nodes.complexity.indentation_complexity"
+        )
+        actual = generate_complexity_trends(
+            hot_spots, git_file_commits, git_repository, 1, cache_path
+        )
+
+        assert actual == expected
+        measure.assert_not_called()
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+)
+from kedro_code_forensics.nodes.coupling import (
+    SumOfCoupling,
+    TemporalCoupling,
+    generate_sum_of_coupling,
+    generate_temporal_coupling,
+)
+
+
+@pytest.fixture
+def coupled_git_file_commits():
+    changesets = [
+        ("h1", ["a.py", "b.py"]),
+        ("h2", ["a.py", "b.py", "c.py"]),
+        ("h3", ["a.py", "c.py"]),
+        ("h4", ["b.py"]),
+        ("h5", ["a.py", "b.py", "c.py", "d.py"]),
+    ]
+    date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    committer = Committer("A", "a@b")
+    return [
+        GitFileCommit(commit_hash, date, committer, "m", filepath, 1, 1)
+        for commit_hash, filepaths in changesets
+        for filepath in filepaths
+    ]
+
+
+class TestCoupling:
+    def test_generate_temporal_coupling(self, coupled_git_file_commits):
+        actual = generate_temporal_coupling(
+            coupled_git_file_commits,
+            min_revisions=1,
+            min_shared_revisions=2,
+            min_coupling=50,
+            max_changeset_size=3,
+        )
+
+        assert actual == [
+            TemporalCoupling("a.py", "c.py", 80.0, 2, 2.5),
+            TemporalCoupling("a.py", "b.py", 2 / 3 * 100, 2, 3.0),
+        ]
+
+    def test_generate_temporal_coupling_from_table(self, coupled_git_file_commits):
+        table = GitFileCommitTable.from_commits(coupled_git_file_commits)
+
+        actual = generate_temporal_coupling(table, 4, 1, 0, 0)
+
+        assert actual == [
+            TemporalCoupling("a.py", "b.py", 75.0, 3, 4.0),
+        ]
+
+    def test_generate_sum_of_coupling(self, coupled_git_file_commits):
+        actual = generate_sum_of_coupling(coupled_git_file_commits, 3)
+
+        assert actual == [
+            SumOfCoupling("a.py", 4),
+            SumOfCoupling("b.py", 3),
+            SumOfCoupling("c.py", 3),
+        ]
@@ -0,0 +1,57 @@
+import numpy as np
+
+from kedro_code_forensics.io.cloc_file import ClocFile
+from kedro_code_forensics.nodes.delta import HotSpotDelta, generate_hot_spot_deltas
+from kedro_code_forensics.nodes.transformations import GitRevisionAggregateTable
+
+
+def _revision_table(*rows):
+    filepaths, revisions, insertions, deletions = zip(*rows)
+    return GitRevisionAggregateTable(
+        list(filepaths), np.array(revisions), np.array(insertions), np.array(deletions)
+    )
+
+
+class TestDelta:
+    def test_generate_hot_spot_deltas(self):
+        base_git_revisions = _revision_table(
+            ("a.py", 3, 30, 3), ("b.py", 2, 20, 0), ("d.py", 1, 5, 0)
+        )
+        base_only_git_revisions = _revision_table(("a.py", 1, 5, 1))
+        head_only_git_revisions = _revision_table(("b.py", 2, 10, 2), ("c.py", 1, 4, 0))
+        base_cloc_files = [
+            ClocFile("a.py", 0, 0, 10, "Python"),
+            ClocFile("b.py", 0, 0, 20, "Python"),
+            ClocFile("d.py", 0, 0, 5, "Python"),
+        ]
+        head_cloc_files = [
+            ClocFile("a.py", 0, 0, 10, "Python"),
+            ClocFile("b.py", 0, 0, 25, "Python"),
+            ClocFile("c.py", 0, 0, 4, "Python"),
+            ClocFile("d.py", 0, 0, 5, "Python"),
+        ]
+
+        actual = generate_hot_spot_deltas(
+            base_git_revisions,
+            base_only_git_revisions,
+            head_only_git_revisions,
+            base_cloc_files,
+            head_cloc_files,
+            0,
+        )
+
+        assert actual == [
+            HotSpotDelta("b.py", 25, 2, 12, 60, 40, 100),
+            HotSpotDelta("c.py", 4, 1, 4, 4, 0, 4),
+            HotSpotDelta("a.py", 10, -1, -6, -10, 30, 20),
+        ]
+
+        top = generate_hot_spot_deltas(
+            base_git_revisions,
+            base_only_git_revisions,
+            head_only_git_revisions,
+            base_cloc_files,
+            head_cloc_files,
+            1,
+        )
+        assert top == actual[:1]
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from kedro_code_forensics.io.cloc_file import ClocFile
+from kedro_code_forensics.io.git_file_commit import Committer, GitFileCommit
+from kedro_code_forensics.nodes.history import HotSpotWindow, generate_hot_spot_history
+from kedro_code_forensics.nodes.transformations import HotSpotData
+
+
+@pytest.fixture
+def quarterly_git_file_commits():
+    committer = Committer("A", "a@b")
+    changes = [
+        (datetime(2020, 1, 15), "a.py"),
+        (datetime(2020, 2, 1), "a.py"),
+        (datetime(2020, 3, 31), "b.py"),
+        (datetime(2020, 7, 2), "b.py"),
+        (datetime(2020, 7, 3), "deleted.py"),
+    ]
+    return [
+        GitFileCommit(
+            f"h{i}",
+            commit_date.replace(tzinfo=timezone.utc),
+            committer,
+            "m",
+            filepath,
+            1,
+            0,
+        )
+        for i, (commit_date, filepath) in enumerate(changes)
+    ]
+
+
+@pytest.fixture
+def quarterly_cloc_files():
+    return [
+        ClocFile("a.py", 0, 0, 10, "Python"),
+        ClocFile("b.py", 0, 0, 30, "Python"),
+    ]
+
+
+class TestHistory:
+    def test_generate_hot_spot_history_by_quarter(
+        self, quarterly_git_file_commits, quarterly_cloc_files
+    ):
+        actual = generate_hot_spot_history(
+            quarterly_git_file_commits, quarterly_cloc_files, "month", 3, 3, 0, 0
+        )
+
+        assert actual == [
+            HotSpotWindow(
+                date(2020, 1, 1),
+                date(2020, 4, 1),
+                [HotSpotData("a.py", 2, 10, 20), HotSpotData("b.py", 1, 30, 30)],
+            ),
+            HotSpotWindow(date(2020, 4, 1), date(2020, 7, 1), []),
+            HotSpotWindow(
+                date(2020, 7, 1), date(2020, 10, 1), [HotSpotData("b.py", 1, 30, 30)]
+            ),
+        ]
+
+    def test_generate_hot_spot_history_overlapping_windows(
+        self, quarterly_git_file_commits, quarterly_cloc_files
+    ):
+        actual = generate_hot_spot_history(
+            quarterly_git_file_commits, quarterly_cloc_files, "month", 3, 1, 1, 0
+        )
+
+        assert [len(window.hot_spots) for window in actual] == [1, 1, 1, 0, 1, 1, 1]
+        assert [window.hot_spots[0].filepath for window in actual[:3]] == [
+            "b.py",
+            "b.py",
+            "b.py",
+        ]
+        assert actual[1].hot_spots[0].revisions == 1
+        assert actual[-1].start == date(2020, 7, 1)
+
+    def test_generate_hot_spot_history_rejects_empty_windows(
+        self, quarterly_git_file_commits, quarterly_cloc_files
+    ):
+        with pytest.raises(ValueError):
+            generate_hot_spot_history(
+                quarterly_git_file_commits, quarterly_cloc_files, "month", 0, 1, 0, 0
+            )
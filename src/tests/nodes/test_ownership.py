@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+
+from kedro_code_forensics.io.git_file_commit import (
+    Committer,
+    GitFileCommit,
+    GitFileCommitTable,
+)
+from kedro_code_forensics.nodes.ownership import FileOwnership, generate_file_ownership
+
+ANN = Committer("Ann", "ann@example.com")
+BOB = Committer("Bob", "bob@example.com")
+
+
+class TestOwnership:
+    def test_generate_file_ownership(self):
+        date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        changes = [
+            (ANN, "a.py", 30),
+            (BOB, "a.py", 10),
+            (BOB, "a.py", 20),
+            (ANN, "b.py", 5),
+            (BOB, "c.py", 0),
+            (ANN, "c.py", 0),
+            (BOB, "c.py", 0),
+        ]
+        git_file_commits = [
+            GitFileCommit(f"h{i}", date, committer, "m", filepath, insertions, 0)
+            for i, (committer, filepath, insertions) in enumerate(changes)
+        ]
+
+        actual = generate_file_ownership(git_file_commits)
+
+        assert actual == [
+            # Tied on lines, Bob has more revisions
+            FileOwnership("a.py", BOB, 0.5, 2, 1.0),
+            FileOwnership("b.py", ANN, 1.0, 1, 0.0),
+            FileOwnership("c.py", BOB, 0.0, 2, 0.0),
+        ]
+        table = GitFileCommitTable.from_commits(git_file_commits)
+        assert generate_file_ownership(table) == actual
+        assert generate_file_ownership([]) == []
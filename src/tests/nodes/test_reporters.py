@@ -1,4 +1,12 @@
-from kedro_code_forensics.nodes.reporters import _extract_path
+from kedro_code_forensics.io.bubble_packer import BubblePack
+from kedro_code_forensics.nodes.age import CodeAge
+from kedro_code_forensics.nodes.delta import HotSpotDelta
+from kedro_code_forensics.nodes.reporters import (
+    _extract_path,
+    report_code_age_bubble_pack,
+    report_hot_spot_delta_bubble_pack,
+)
+from kedro_code_forensics.nodes.transformations import HotSpotData
 
 
 class TestReporters:
@@ -7,3 +15,25 @@ class TestReporters:
         actual = _extract_path(filepath)
         expected = ["dir1", "dir2", "dir3", "file1"]
         assert actual == expected
+
+    def test_report_code_age_bubble_pack(self):
+        hot_spots = [HotSpotData("a/b.py", 2, 10, 20), HotSpotData("c.py", 1, 5, 5)]
+        code_ages = [CodeAge("a/b.py", 0, 3.5)]
+
+        actual = report_code_age_bubble_pack(hot_spots, code_ages)
+
+        assert actual == [BubblePack(["a", "b.py"], 10, 20, 3.5)]
+
+    def test_report_hot_spot_delta_bubble_pack(self):
+        hot_spot_deltas = [
+            HotSpotDelta("a/b.py", 10, 2, 12, 60, 40, 100),
+            HotSpotDelta("c.py", 4, 1, 4, 0, 4, 4),
+            HotSpotDelta("d.py", 5, -1, -6, -10, 30, 20),
+        ]
+
+        actual = report_hot_spot_delta_bubble_pack(hot_spot_deltas)
+
+        assert actual == [
+            BubblePack(["a", "b.py"], 10, 60, 60),
+            BubblePack(["d.py"], 5, 10, -10),
+        ]
@@ -1,9 +1,16 @@
 from kedro_code_forensics.io.cloc_file import ClocFile
+from kedro_code_forensics.io.cyclomatic import CyclomaticComplexity
+from kedro_code_forensics.io.git_file_commit import GitFileCommit, GitFileCommitTable
+from kedro_code_forensics.io.indentation import IndentationComplexity
+from kedro_code_forensics.nodes import transformations
 from kedro_code_forensics.nodes.transformations import (
     GitRevisionAggregate,
     HotSpotData,
+    generate_cyclomatic_hot_spots,
+    generate_git_revision_aggregate_table,
     generate_git_revision_aggregates,
     generate_hot_spots,
+    generate_indentation_hot_spots,
 )
 
 
@@ -47,6 +54,35 @@ class TestTransformations:
 
         assert actual == expected
 
+    def test_generate_git_revisions_from_stream(self, basic_git_file_commits, mocker):
+        mocker.patch.object(transformations, "AGGREGATION_BATCH_SIZE", 3)
+        actual = generate_git_revision_aggregates(iter(basic_git_file_commits * 2))
+
+        assert actual == generate_git_revision_aggregates(basic_git_file_commits * 2)
+        assert generate_git_revision_aggregates(iter([])) == {}
+
+    def test_generate_git_revisions_from_table(self, basic_git_file_commits):
+        table = GitFileCommitTable.from_commits(basic_git_file_commits * 2)
+        actual = generate_git_revision_aggregates(table)
+
+        assert actual == generate_git_revision_aggregates(basic_git_file_commits * 2)
+
+    def test_generate_git_revision_aggregate_table(self, basic_git_file_commits):
+        actual = generate_git_revision_aggregate_table(basic_git_file_commits * 2)
+
+        assert actual.filepaths == [
+            "src/kedro_code_forensics/io/git_file_commit.py",
+            "src/kedro_code_forensics/run.py",
+        ]
+        assert actual.revisions.tolist() == [2, 6]
+        assert actual.insertions.tolist() == [2, 174]
+        assert actual.deletions.tolist() == [6, 16]
+
+        table = GitFileCommitTable.from_commits(basic_git_file_commits * 2)
+        assert generate_git_revision_aggregate_table(table).to_dict() == (
+            actual.to_dict()
+        )
+
     def test_generate_hot_spot_data(self):
         simple_revisions = [("file1", 2, 2, 3), ("file2", 3, 4, 5), ("file3", 4, 8, 8)]
         git_revisions = {
@@ -65,3 +101,72 @@ class TestTransformations:
             HotSpotData(filepath="file3", revisions=4, lines=3, rating=12),
         ]
         assert actual == expected
+
+        indentation = {"file2": IndentationComplexity(3, 2.0, 1.0, 2.0, 1.0)}
+        actual = generate_indentation_hot_spots(git_revisions, cloc_files, indentation)
+        assert [hot_spot.indentation for hot_spot in actual] == [
+            None,
+            indentation["file2"],
+            None,
+        ]
+
+    def test_generate_hot_spots_top_k_and_min_rating(self):
+        git_revisions = generate_git_revision_aggregate_table(
+            [
+                GitFileCommit("h1", None, None, "m", "a.py", 1, 0),
+                GitFileCommit("h1", None, None, "m", "b.py", 1, 0),
+                GitFileCommit("h2", None, None, "m", "b.py", 1, 0),
+                GitFileCommit("h2", None, None, "m", "c.py", 1, 0),
+                GitFileCommit("h3", None, None, "m", "c.py", 1, 0),
+                GitFileCommit("h4", None, None, "m", "c.py", 1, 0),
+            ]
+        )
+        cloc_files = [
+            ClocFile("a.py", 0, 0, 10, "Python"),
+            ClocFile("b.py", 0, 0, 3, "Python"),
+            ClocFile("c.py", 0, 0, 5, "Python"),
+            ClocFile("untracked.py", 0, 0, 100, "Python"),
+        ]
+
+        actual = generate_hot_spots(git_revisions, cloc_files, top_k=2)
+        assert actual == [
+            HotSpotData("c.py", revisions=3, lines=5, rating=15),
+            HotSpotData("a.py", revisions=1, lines=10, rating=10),
+        ]
+
+        actual = generate_hot_spots(git_revisions, cloc_files, min_rating=7)
+        assert [hot_spot.filepath for hot_spot in actual] == ["c.py", "a.py"]
+
+        actual = generate_hot_spots(git_revisions, [], top_k=2)
+        assert actual == []
+
+    def test_generate_hot_spots_breaks_rating_ties_by_revisions(self):
+        git_revisions = generate_git_revision_aggregate_table(
+            [
+                GitFileCommit("h1", None, None, "m", "a.py", 1, 0),
+                GitFileCommit("h1", None, None, "m", "b.py", 1, 0),
+                GitFileCommit("h2", None, None, "m", "b.py", 1, 0),
+            ]
+        )
+        cloc_files = [
+            ClocFile("a.py", 0, 0, 4, "Python"),
+            ClocFile("b.py", 0, 0, 2, "Python"),
+        ]
+
+        for kept in ({"top_k": 1}, {"min_rating": 1}):
+            actual = generate_hot_spots(git_revisions, cloc_files, **kept)
+            assert actual[0] == HotSpotData("b.py", revisions=2, lines=2, rating=4)
+
+    def test_generate_cyclomatic_hot_spots(self):
+        git_revisions = {
+            "a.py": GitRevisionAggregate("a.py", 2, 10, 1),
+            "b.py": GitRevisionAggregate("b.py", 5, 3, 3),
+        }
+        complexities = {
+            "a.py": CyclomaticComplexity(7, ()),
+            "c.py": CyclomaticComplexity(3, ()),
+        }
+
+        actual = generate_cyclomatic_hot_spots(git_revisions, complexities)
+
+        assert actual == [HotSpotData("a.py", revisions=2, lines=7, rating=14)]